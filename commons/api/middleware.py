@@ -3,65 +3,99 @@ from ipaddress import ip_address, ip_network
 
 import httpx
 from bittensor.utils.btlogging import logging as logger
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 MAX_CONTENT_LENGTH = 1 * 1024 * 1024
 
 
-class LimitContentLengthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        content_length = int(request.headers.get("content-length", 0))
-        if content_length <= MAX_CONTENT_LENGTH:
-            return await call_next(request)
-        return Response(status_code=413)
+class LimitContentLengthMiddleware:
+    """Reject requests whose declared content-length exceeds MAX_CONTENT_LENGTH.
 
+    Implemented as plain ASGI so the raw header list from the scope is scanned
+    once, without building a Request/Headers object or wrapping the response
+    stream like BaseHTTPMiddleware does.
+    """
 
-class AWSIPFilterMiddleware(BaseHTTPMiddleware):
-    """Middleware to ensure that only requests from AWS Servers are allowed."""
+    def __init__(self, app: ASGIApp, max_content_length: int = MAX_CONTENT_LENGTH):
+        self.app = app
+        self.max_content_length = max_content_length
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            for key, value in scope["headers"]:
+                if key != b"content-length":
+                    continue
+                content_length = int(value)
+                if content_length > self.max_content_length:
+                    response = Response(status_code=413)
+                    await response(scope, receive, send)
+                    return
+                break
+        await self.app(scope, receive, send)
+
+
+class AWSIPFilterMiddleware:
+    """Middleware to ensure that only requests from AWS Servers are allowed.
+
+    Plain ASGI, the client address is read straight from the scope instead of
+    building a Request per call.
+    """
 
     _aws_ips_url = "https://ip-ranges.amazonaws.com/ip-ranges.json"
     _allowed_ip_ranges = []
     _last_checked: float = 0
     _allowed_networks = []
     _allowed_regions = {"us-east-1"}
+    # reused across refreshes so the connection pool and TLS session are kept
+    _client: httpx.AsyncClient | None = None
 
     @classmethod
     async def _get_allowed_networks(cls):
-        return [ip_network(ip_range) for ip_range in await cls._get_allowed_ip_ranges()]
+        if (time.time() - cls._last_checked) < 300:
+            return cls._allowed_networks
+
+        # parse the prefixes once per refresh, not on every request
+        cls._allowed_networks = [
+            ip_network(ip_range) for ip_range in await cls._get_allowed_ip_ranges()
+        ]
+        return cls._allowed_networks
 
     @classmethod
     async def _get_allowed_ip_ranges(cls):
         if (time.time() - cls._last_checked) < 300:
             return cls._allowed_ip_ranges
 
-        async with httpx.AsyncClient() as client:
-            start_time = time.time()
-            response = await client.get(cls._aws_ips_url)
-            cls._last_checked = time.time()
-            elapsed_time = cls._last_checked - start_time
-            logger.debug(
-                f"Sent request to {cls._aws_ips_url}, took {elapsed_time:.2f} seconds"
-            )
-            data = response.json()
-            cls._allowed_ip_ranges = [
-                ip_range["ip_prefix"]
-                for ip_range in data["prefixes"]
-                if ip_range["region"] in cls._allowed_regions
-            ]
+        if cls._client is None:
+            cls._client = httpx.AsyncClient()
+
+        start_time = time.time()
+        response = await cls._client.get(cls._aws_ips_url)
+        cls._last_checked = time.time()
+        elapsed_time = cls._last_checked - start_time
+        logger.debug(
+            f"Sent request to {cls._aws_ips_url}, took {elapsed_time:.2f} seconds"
+        )
+        data = response.json()
+        cls._allowed_ip_ranges = [
+            ip_range["ip_prefix"]
+            for ip_range in data["prefixes"]
+            if ip_range["region"] in cls._allowed_regions
+        ]
         return cls._allowed_ip_ranges
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next):
-        client_ip = ip_address(request.client.host)
-        allowed_networks = [
-            ip_network(ip_range) for ip_range in await self._get_allowed_networks()
-        ]
-        for network in allowed_networks:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = ip_address(scope["client"][0])
+        for network in await self._get_allowed_networks():
             if client_ip in network:
-                response = await call_next(request)
-                return response
-        return Response("Forbidden", status_code=403)
+                await self.app(scope, receive, send)
+                return
+        response = Response("Forbidden", status_code=403)
+        await response(scope, receive, send)
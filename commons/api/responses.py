@@ -0,0 +1,33 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any):
+    # pydantic models nested inside other content dump themselves
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    # jsonable_encoder turned these into lists, keep the same output
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONModelResponse(ORJSONResponse):
+    """ORJSONResponse that serializes pydantic models itself, so handlers can
+    return them as-is instead of walking them with jsonable_encoder first."""
+
+    def render(self, content: Any) -> bytes:
+        # a model returned directly is serialized by pydantic-core in one go,
+        # rather than dumped to a dict first and then re-encoded by orjson
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_UTC_Z,
+        )
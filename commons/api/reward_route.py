@@ -1,8 +1,9 @@
+import orjson
 from bittensor.utils.btlogging import logging as logger
-from fastapi import APIRouter, Header, Request, responses
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Header, Request
 from pydantic.error_wrappers import ValidationError
 
+from commons.api.responses import ORJSONModelResponse
 from commons.cache import RedisCache
 from commons.objects import ObjectManager
 from commons.utils import get_new_uuid
@@ -26,36 +27,33 @@ async def get_token(request: Request):
 async def reward_request_handler(
     request: Request, authorization: str | None = Header(default=None)
 ):
-    token = authorization.split(" ")[1]
+    # "Bearer <token>", a missing or malformed header yields an empty token
+    token = (authorization or "").partition(" ")[2]
     client_host = request.client.host
     if token != await cache.get(client_host):
-        return responses.JSONResponse(
-            status_code=403, content={"message": "Invalid token"}
-        )
+        return ORJSONModelResponse({"message": "Invalid token"}, status_code=403)
 
     try:
-        request_data = await request.json()
+        # parse the raw body bytes directly, Request.json() decodes to str first
+        request_data = orjson.loads(await request.body())
         request_data["task_type"] = request_data.pop("task")
         request_data["criteria_types"] = request_data.pop("criteria")
 
         logger.info("Received task data from external user")
         logger.debug(f"Task data: {request_data}")
         task_data = FeedbackRequest.parse_obj(request_data)
-    except (KeyError, ValidationError):
+    except (KeyError, ValidationError, orjson.JSONDecodeError):
         logger.error("Invalid data sent by external user")
-        return responses.JSONResponse(
-            status_code=400, content={"message": "Invalid request data"}
-        )
+        return ORJSONModelResponse({"message": "Invalid request data"}, status_code=400)
     except Exception as e:
         logger.exception(f"Encountered exception: {e}")
-        return responses.JSONResponse(
-            status_code=500, content={"message": "Internal server error"}
+        return ORJSONModelResponse(
+            {"message": "Internal server error"}, status_code=500
         )
 
     try:
         validator = ObjectManager.get_validator()
         response = await validator.send_request(task_data, external_user=True)
-        response_json = jsonable_encoder(response)
-        return responses.JSONResponse(content=response_json)
+        return ORJSONModelResponse(response)
     except Exception as e:
         logger.exception(f"Encountered exception: {e}")
@@ -32,7 +32,16 @@ class RedisCache:
     async def connect(self):
         if self.redis is None:
             redis_url = build_redis_url()
-            self.redis = await aioredis.from_url(redis_url)
+            # one explicitly sized pool shared by all concurrent cache calls, callers
+            # wait up to `timeout` seconds for a free connection instead of failing
+            pool = aioredis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", 64)),
+                timeout=int(os.getenv("REDIS_POOL_TIMEOUT", 20)),
+                socket_keepalive=True,
+                health_check_interval=30,
+            )
+            self.redis = aioredis.Redis(connection_pool=pool)
 
     async def put(self, key: str, value: dict):
         if self.redis is None:
@@ -49,4 +58,6 @@ class RedisCache:
 
     async def close(self):
         if self.redis:
-            await self.redis.aclose()
+            # pools passed in explicitly are not closed along with the client
+            await self.redis.aclose(close_connection_pool=True)
+            self.redis = None
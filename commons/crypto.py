@@ -0,0 +1,43 @@
+"""Thin sr25519 signature verification for ss58 encoded hotkeys.
+
+Bittensor hotkeys are sr25519 keys, so verifying a signature only needs the
+ss58 decode plus the curve op. substrateinterface.Keypair does the same work
+but goes through several wrapper layers on every call.
+"""
+
+from functools import lru_cache
+
+import sr25519
+from scalecodec.utils.ss58 import ss58_decode
+
+SS58_FORMAT = 42
+
+
+# bounded so a flood of unknown hotkeys can't grow it, 4096 covers any subnet
+@lru_cache(maxsize=4096)
+def get_public_key(hotkey: str) -> bytes:
+    """Decode an ss58 hotkey to its raw public key, cached per hotkey."""
+    return bytes.fromhex(
+        ss58_decode(hotkey, valid_ss58_format=SS58_FORMAT).removeprefix("0x")
+    )
+
+
+def verify(public_key: bytes, message: str | bytes, signature: str | bytes) -> bool:
+    """Verify an sr25519 signature, mirroring substrateinterface.Keypair.verify.
+
+    Hex strings (0x prefixed) are decoded for both message and signature, and a
+    failed check is retried with the message wrapped in <Bytes></Bytes> as
+    polkadot-js does when signing.
+    """
+    if isinstance(message, str):
+        message = (
+            bytes.fromhex(message[2:]) if message[0:2] == "0x" else message.encode()
+        )
+    if isinstance(signature, str):
+        if signature[0:2] != "0x":
+            raise TypeError("Signature should be of type bytes or a hex-string")
+        signature = bytes.fromhex(signature[2:])
+
+    if sr25519.verify(signature, message, public_key):
+        return True
+    return sr25519.verify(signature, b"<Bytes>" + message + b"</Bytes>", public_key)
@@ -4,9 +4,9 @@ import traceback
 import aiohttp
 from bittensor.utils.btlogging import logging as logger
 from tenacity import (
-    AsyncRetrying,
     RetryError,
     before_sleep_log,
+    retry,
     stop_after_attempt,
     wait_exponential,
 )
@@ -14,6 +14,7 @@ from tenacity import (
 from dojo.protocol import SyntheticQA
 
 SYNTHETIC_API_BASE_URL = os.getenv("SYNTHETIC_API_URL")
+MAX_RETRIES = 6
 
 
 def _map_synthetic_response(response: dict) -> SyntheticQA:
@@ -57,6 +58,23 @@ class SyntheticAPI:
             cls._session = None
         logger.debug("Ensured SyntheticAPI session is closed.")
 
+    @classmethod
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential(multiplier=1, max=30),
+        before_sleep=before_sleep_log(logger._logger, log_level=10, exc_info=True),
+    )
+    async def _fetch_qa(cls, path: str) -> SyntheticQA:
+        # retry policy is built once at decoration time, not on every call
+        async with cls._session.get(path) as response:
+            response.raise_for_status()
+            response_json = await response.json()
+            if "body" not in response_json:
+                raise ValueError("Invalid response from the server.")
+            synthetic_qa = _map_synthetic_response(response_json["body"])
+            logger.info("Synthetic QA generated and parsed successfully")
+            return synthetic_qa
+
     @classmethod
     async def get_qa(cls) -> SyntheticQA | None:
         await cls.init_session()
@@ -64,29 +82,11 @@ class SyntheticAPI:
         path = f"{SYNTHETIC_API_BASE_URL}/api/synthetic-gen"
         logger.debug(f"Generating synthetic QA from {path}.")
 
-        MAX_RETRIES = 6
         try:
-            async for attempt in AsyncRetrying(
-                stop=stop_after_attempt(MAX_RETRIES),
-                wait=wait_exponential(multiplier=1, max=30),
-                before_sleep=before_sleep_log(
-                    logger._logger, log_level=10, exc_info=True
-                ),
-            ):
-                with attempt:
-                    async with cls._session.get(path) as response:
-                        response.raise_for_status()
-                        response_json = await response.json()
-                        if "body" not in response_json:
-                            raise ValueError("Invalid response from the server.")
-                        synthetic_qa = _map_synthetic_response(response_json["body"])
-                        logger.info("Synthetic QA generated and parsed successfully")
-                        return synthetic_qa
+            return await cls._fetch_qa(path)
         except RetryError:
             logger.error(
                 f"Failed to generate synthetic QA after {MAX_RETRIES} retries."
             )
             traceback.print_exc()
             raise
-        except Exception:
-            raise
@@ -5,6 +5,7 @@ import random
 from typing import Dict, List
 
 import httpx
+import orjson
 from bittensor.utils.btlogging import logging as logger
 
 import dojo
@@ -27,8 +28,15 @@ def _get_max_results_param() -> int:
 
 
 class DojoAPI:
+    # shared for the lifetime of the process so connections and TLS sessions to
+    # the Dojo API are kept alive between task creation and result polling
     _http_client = httpx.AsyncClient()
 
+    @classmethod
+    async def close_session(cls):
+        await cls._http_client.aclose()
+        logger.debug("Ensured DojoAPI http client is closed.")
+
     @classmethod
     async def _get_task_by_id(cls, task_id: str):
         """Gets task by task id and checks completion status"""
@@ -118,30 +126,25 @@ class DojoAPI:
         response_json = {}
         max_retries = 5
         base_delay = 1
+        # the task data doesn't change between attempts, serialize it only once
+        task_data_json = None
 
         for attempt in range(max_retries):
             try:
                 path = f"{DOJO_API_BASE_URL}/api/v1/tasks/create-tasks"
-                taskData = cls.serialize_feedback_request(feedback_request)
-                for criteria_type in feedback_request.criteria_types:
-                    if isinstance(criteria_type, RankingCriteria) or isinstance(
-                        criteria_type, MultiScoreCriteria
-                    ):
-                        taskData["criteria"].append(
-                            {
-                                **criteria_type.model_dump(),
-                                "options": [
-                                    option
-                                    for option in criteria_type.model_dump().get(
-                                        "options", []
-                                    )
-                                ],
-                            }
-                        )
-                    else:
-                        logger.error(
-                            f"Unrecognized criteria type: {type(criteria_type)}"
-                        )
+                if task_data_json is None:
+                    taskData = cls.serialize_feedback_request(feedback_request)
+                    for criteria_type in feedback_request.criteria_types:
+                        if isinstance(criteria_type, RankingCriteria) or isinstance(
+                            criteria_type, MultiScoreCriteria
+                        ):
+                            # model_dump already returns a fresh options list
+                            taskData["criteria"].append(criteria_type.model_dump())
+                        else:
+                            logger.error(
+                                f"Unrecognized criteria type: {type(criteria_type)}"
+                            )
+                    task_data_json = orjson.dumps([taskData]).decode()
 
                 expire_at = set_expire_time(dojo.TASK_DEADLINE)
 
@@ -150,7 +153,7 @@ class DojoAPI:
                     "title": ("", "LLM Code Generation Task"),
                     "body": ("", feedback_request.prompt),
                     "expireAt": ("", expire_at),
-                    "taskData": ("", json.dumps([taskData])),
+                    "taskData": ("", task_data_json),
                     "maxResults": ("", str(max_results)),
                 }
 
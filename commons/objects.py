@@ -9,30 +9,33 @@ class ObjectManager:
 
     @classmethod
     def get_miner(cls):
+        # imports are deferred to first construction, later calls return directly
+        if cls._miner is not None:
+            return cls._miner
+
         if get_config().simulation:
             from simulator.miner import MinerSim
 
-            if cls._miner is None:
-                cls._miner = MinerSim()
+            cls._miner = MinerSim()
         else:
             from neurons.miner import Miner
 
-            if cls._miner is None:
-                cls._miner = Miner()
+            cls._miner = Miner()
         return cls._miner
 
     @classmethod
     def get_validator(cls):
+        if cls._validator is not None:
+            return cls._validator
+
         if get_config().simulation:
             from simulator.validator import ValidatorSim
 
-            if cls._validator is None:
-                cls._validator = ValidatorSim()
+            cls._validator = ValidatorSim()
         else:
             from neurons.validator import Validator
 
-            if cls._validator is None:
-                cls._validator = Validator()
+            cls._validator = Validator()
         return cls._validator
 
     @classmethod
@@ -1,10 +1,10 @@
 import asyncio
-import gc
-import json
 import math
 from datetime import datetime, timedelta, timezone
 from typing import AsyncGenerator, List
 
+import numpy as np
+import orjson
 import torch
 from bittensor.utils.btlogging import logging as logger
 
@@ -22,6 +22,7 @@ from database.mappers import (
     map_completion_response_to_model,
     map_criteria_type_to_model,
     map_feedback_request_model_to_feedback_request,
+    map_miner_response_model_to_feedback_request,
     map_parent_feedback_request_to_model,
 )
 from database.prisma import Json
@@ -43,7 +44,6 @@ from database.prisma.types import (
 from dojo import TASK_DEADLINE
 from dojo.protocol import (
     CodeAnswer,
-    CompletionResponses,
     DendriteQueryResponse,
     FeedbackRequest,
 )
@@ -80,13 +80,19 @@ class ORM:
 
         """
 
-        # find all validator requests first
-        include_query = Feedback_Request_ModelInclude(
+        # find all validator requests first, only fetch the relations the mappers
+        # read, miner responses carry no ground truths so skip that join for them
+        vali_include_query = Feedback_Request_ModelInclude(
             {
                 "completions": True,
                 "criteria_types": True,
                 "ground_truths": True,
-                "parent_request": True,
+            }
+        )
+        miner_include_query = Feedback_Request_ModelInclude(
+            {
+                "completions": True,
+                "criteria_types": True,
             }
         )
 
@@ -136,7 +142,7 @@ class ORM:
         for i in range(0, task_count_unprocessed, batch_size):
             # find all unprocesed validator requests
             validator_requests = await Feedback_Request_Model.prisma().find_many(
-                include=include_query,
+                include=vali_include_query,
                 where=vali_where_query_unprocessed,
                 order={"created_at": "desc"},
                 skip=i,
@@ -146,7 +152,7 @@ class ORM:
             # find all miner responses
             unprocessed_validator_request_ids = [r.id for r in validator_requests]
             miner_responses = await Feedback_Request_Model.prisma().find_many(
-                include=include_query,
+                include=miner_include_query,
                 where={
                     "parent_id": {"in": unprocessed_validator_request_ids},
                     "is_processed": {"equals": False},
@@ -162,9 +168,7 @@ class ORM:
 
                 m_responses = list(
                     map(
-                        lambda x: map_feedback_request_model_to_feedback_request(
-                            x, is_miner=True
-                        ),
+                        map_miner_response_model_to_feedback_request,
                         [
                             m
                             for m in miner_responses
@@ -186,12 +190,28 @@ class ORM:
         yield [], False
 
     @staticmethod
-    async def get_real_model_ids(request_id: str) -> dict[str, str]:
-        """Fetches a mapping of obfuscated model IDs to real model IDs for a given request ID."""
+    async def get_real_model_ids_by_request_ids(
+        request_ids: list[str],
+    ) -> dict[str, dict[str, str]]:
+        """Fetches the mapping of obfuscated model IDs to real model IDs for each
+        request ID, using a single query for all of them.
+
+        Args:
+            request_ids (list[str]): List of request ids.
+
+        Returns:
+            dict[str, dict[str, str]]: Request id to obfuscated -> real model id,
+                request ids without ground truths map to an empty dict.
+        """
         ground_truths = await Ground_Truth_Model.prisma().find_many(
-            where={"request_id": request_id}
+            where={"request_id": {"in": request_ids}}
         )
-        return {gt.obfuscated_model_id: gt.real_model_id for gt in ground_truths}
+        real_model_ids: dict[str, dict[str, str]] = {
+            request_id: {} for request_id in request_ids
+        }
+        for gt in ground_truths:
+            real_model_ids[gt.request_id][gt.obfuscated_model_id] = gt.real_model_id
+        return real_model_ids
 
     @staticmethod
     async def mark_tasks_processed_by_request_ids(request_ids: list[str]) -> None:
@@ -221,24 +241,28 @@ class ORM:
     @staticmethod
     async def get_task_by_request_id(request_id: str) -> DendriteQueryResponse | None:
         try:
-            # find the parent id first
+            # find the parent id first, fetching the miner responses along with
+            # the relations their mappers need in the same round trip
             include_query = Feedback_Request_ModelInclude(
                 {
                     "completions": True,
                     "criteria_types": True,
                     "ground_truths": True,
-                    "parent_request": True,
-                    "child_requests": True,
+                    "child_requests": {
+                        "include": {"completions": True, "criteria_types": True}
+                    },
                 }
             )
-            all_requests = await Feedback_Request_Model.prisma().find_many(
+            # miner responses share the request id, let the database filter
+            # them out instead of loading every row and dropping them here
+            validator_requests = await Feedback_Request_Model.prisma().find_many(
                 where={
                     "request_id": request_id,
+                    "parent_id": None,
                 },
                 include=include_query,
             )
 
-            validator_requests = [r for r in all_requests if r.parent_id is None]
             assert len(validator_requests) == 1, "Expected only one validator request"
             validator_request = validator_requests[0]
             if not validator_request.child_requests:
@@ -371,7 +395,6 @@ class ORM:
             logger.success(
                 f"Successfully updated all {num_batches} batches for {len(miner_responses)} responses"
             )
-            gc.collect()
             return True, []
 
         return False, failed_batch_indices
@@ -434,13 +457,13 @@ class ORM:
                         for completion in miner_response.completion_responses:
                             # remove the completion field, since the miner receives an obfuscated completion_response anyways
                             # therefore it is useless for training
-                            try:
-                                completion_copy = completion.model_dump()
-                                completion_copy["completion"] = CodeAnswer(files=[])
-                            except KeyError:
-                                pass
+                            # already validated on the way in, so copy without
+                            # the dump -> model_validate round trip
+                            completion_copy = completion.model_copy(
+                                update={"completion": CodeAnswer(files=[])}
+                            )
                             completion_input = map_completion_response_to_model(
-                                CompletionResponses.model_validate(completion_copy),
+                                completion_copy,
                                 created_miner_model.id,
                             )
                             await tx.completion_response_model.create(
@@ -502,16 +525,19 @@ class ORM:
     async def create_or_update_validator_score(scores: torch.Tensor) -> None:
         # Save scores as a single record
         score_model = await Score_Model.prisma().find_first()
-        scores_list = scores.tolist()
+        # serialize straight from the float buffer rather than via a python list
+        scores_json = orjson.dumps(
+            scores.detach().cpu().numpy(), option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
         if score_model:
             await Score_Model.prisma().update(
                 where={"id": score_model.id},
-                data=Score_ModelUpdateInput(score=Json(json.dumps(scores_list))),
+                data=Score_ModelUpdateInput(score=Json(scores_json)),
             )
         else:
             await Score_Model.prisma().create(
                 data=Score_ModelCreateInput(
-                    score=Json(json.dumps(scores_list)),
+                    score=Json(scores_json),
                 )
             )
 
@@ -523,63 +549,7 @@ class ORM:
         if not score_record:
             return None
 
-        return torch.tensor(json.loads(score_record.score))
-
-    @staticmethod
-    async def get_scores_and_ground_truth_by_dojo_task_id(
-        dojo_task_id: str,
-    ) -> dict[str, dict[str, float | int | None]]:
-        """
-        Fetch the scores, model IDs from Completion_Response_Model for a given Dojo task ID.
-        Also fetches rank IDs from Ground_Truth_Model for the given Dojo task ID.
-
-        Args:
-            dojo_task_id (str): The Dojo task ID to search for.
-
-        Returns:
-            dict[str, dict[str, float | int | None]]: A dictionary mapping model ID to a dict containing score and rank_id.
-        """
-        try:
-            # First, find the Feedback_Request_Model with the given dojo_task_id
-            feedback_request = await Feedback_Request_Model.prisma().find_first(
-                where=Feedback_Request_ModelWhereInput(dojo_task_id=dojo_task_id),
-                include={
-                    "completions": True,
-                    "parent_request": {"include": {"ground_truths": True}},
-                },
-            )
-
-            if not feedback_request:
-                logger.warning(
-                    f"No Feedback_Request_Model found for dojo_task_id: {dojo_task_id}"
-                )
-                return {}
-
-            parent_request = feedback_request.parent_request
-            if not parent_request:
-                logger.warning(
-                    f"No parent request found for dojo_task_id: {dojo_task_id}"
-                )
-                return {}
-
-            rank_id_map = {
-                gt.obfuscated_model_id: gt.rank_id
-                for gt in parent_request.ground_truths
-            }
-
-            # Extract scores from the completions
-            scores_and_gts = {
-                completion.model: {
-                    "score": completion.score,
-                    "ground_truth_rank_id": rank_id_map.get(completion.completion_id),
-                }
-                for completion in feedback_request.completions
-            }
-
-            return scores_and_gts
-
-        except Exception as e:
-            logger.error(
-                f"Error fetching completion scores and ground truths for dojo_task_id {dojo_task_id}: {e}"
-            )
-            return {}
+        scores_list = orjson.loads(score_record.score)
+        return torch.from_numpy(
+            np.fromiter(scores_list, dtype=np.float32, count=len(scores_list))
+        )
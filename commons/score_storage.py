@@ -1,8 +1,12 @@
-import json
+import os
 from pathlib import Path
 
+import numpy as np
+import orjson
 import torch
 from bittensor.utils.btlogging import logging as logger
+from safetensors.torch import load_file
+from safetensors.torch import save as serialize
 
 from database.client import connect_db
 from database.prisma.models import Score_Model
@@ -12,16 +16,71 @@ class ScoreStorage:
     """Handles persistence of validator scores"""
 
     SCORES_DIR = Path("scores")
-    SCORES_FILE = SCORES_DIR / "miner_scores.pt"
+    SCORES_FILE = SCORES_DIR / "miner_scores.safetensors"
+    # pickled format used before switching to safetensors, only ever read once
+    LEGACY_SCORES_FILE = SCORES_DIR / "miner_scores.pt"
+    SCORES_KEY = "scores"
+    # last scores written or read, keyed by the file's mtime so external edits
+    # to the file still get picked up
+    _cached_scores: torch.Tensor | None = None
+    _cached_mtime_ns: int | None = None
+
+    @classmethod
+    def _write(cls, scores: torch.Tensor) -> None:
+        """Write scores atomically, a crash mid-write leaves the old file intact."""
+        cls.SCORES_DIR.mkdir(exist_ok=True)
+        data = serialize({cls.SCORES_KEY: scores.detach().cpu().contiguous()})
+        tmp_file = cls.SCORES_FILE.with_suffix(".tmp")
+        # unbuffered so the whole payload goes out in a single write()
+        with open(tmp_file, "wb", buffering=0) as f:
+            f.write(data)
+            os.fsync(f.fileno())
+        os.replace(tmp_file, cls.SCORES_FILE)
+        cls._cached_scores = scores.detach().cpu().clone()
+        cls._cached_mtime_ns = cls.SCORES_FILE.stat().st_mtime_ns
+
+    @classmethod
+    def _read(cls) -> torch.Tensor:
+        """Read scores, skipping the disk read if the file is unchanged since the
+        last read or write. Returns a copy so callers can't mutate the cache."""
+        mtime_ns = cls.SCORES_FILE.stat().st_mtime_ns
+        if cls._cached_scores is None or cls._cached_mtime_ns != mtime_ns:
+            cls._cached_scores = load_file(cls.SCORES_FILE)[cls.SCORES_KEY]
+            cls._cached_mtime_ns = mtime_ns
+        return cls._cached_scores.clone()
+
+    @classmethod
+    def _migrate_legacy_file(cls) -> torch.Tensor:
+        """Rewrite the legacy pickled .pt scores as safetensors and remove it."""
+        try:
+            scores = torch.load(
+                cls.LEGACY_SCORES_FILE,
+                map_location="cpu",
+                mmap=True,
+                weights_only=True,
+            )
+        except RuntimeError:
+            # files written with the old tar serializer can't be memory mapped
+            scores = torch.load(
+                cls.LEGACY_SCORES_FILE, map_location="cpu", weights_only=True
+            )
+        cls._write(scores)
+        # the loaded tensor may be backed by the mapping of the file removed below
+        del scores
+        cls.LEGACY_SCORES_FILE.unlink()
+        logger.success(
+            f"Migrated scores from {cls.LEGACY_SCORES_FILE} to {cls.SCORES_FILE}"
+        )
+        return cls._read()
 
     @classmethod
     async def migrate_from_db(cls) -> bool:
-        """One-time migration of scores from database to .pt file
+        """One-time migration of scores from database to the scores file
         Returns:
             bool: True if migration successful or file already exists, False if migration failed
         """
         try:
-            if cls.SCORES_FILE.exists():
+            if cls.SCORES_FILE.exists() or cls.LEGACY_SCORES_FILE.exists():
                 logger.info("Scores file already exists, skipping migration")
                 return True
 
@@ -36,24 +95,17 @@ class ScoreStorage:
                 logger.warning("No scores found in database to migrate")
                 return True  # Not an error, just no scores yet
 
-            scores = torch.tensor(json.loads(score_record.score))
-
-            # Create scores directory if it doesn't exist
-            cls.SCORES_DIR.mkdir(exist_ok=True)
+            # build the float32 buffer straight from the parsed list, instead of
+            # having torch box and infer the dtype of every element
+            scores_list = orjson.loads(score_record.score)
+            scores = torch.from_numpy(
+                np.fromiter(scores_list, dtype=np.float32, count=len(scores_list))
+            )
 
-            # Save scores to .pt file
-            torch.save(scores, cls.SCORES_FILE)
+            # Save scores to file, creating the scores directory if needed
+            cls._write(scores)
             logger.success(f"Successfully migrated scores to {cls.SCORES_FILE}")
-
-            # Verify the migration
-            loaded_scores = torch.load(cls.SCORES_FILE)
-
-            if torch.equal(scores, loaded_scores):
-                logger.success("Migration verification successful - scores match")
-                return True
-            else:
-                logger.error("Migration verification failed - scores do not match")
-                return False
+            return True
 
         except Exception as e:
             logger.error(f"Failed to migrate scores: {e}")
@@ -61,10 +113,9 @@ class ScoreStorage:
 
     @classmethod
     async def save(cls, scores: torch.Tensor) -> None:
-        """Save validator scores to .pt file"""
+        """Save validator scores to file"""
         try:
-            cls.SCORES_DIR.mkdir(exist_ok=True)
-            torch.save(scores, cls.SCORES_FILE)
+            cls._write(scores)
             logger.success("Successfully saved validator scores to file")
         except Exception as e:
             logger.error(f"Failed to save validator scores: {e}")
@@ -72,13 +123,15 @@ class ScoreStorage:
 
     @classmethod
     async def load(cls) -> torch.Tensor | None:
-        """Load validator scores from .pt file"""
+        """Load validator scores from file"""
         try:
             if not cls.SCORES_FILE.exists():
+                if cls.LEGACY_SCORES_FILE.exists():
+                    return cls._migrate_legacy_file()
                 logger.warning("No validator scores file found")
                 return None
 
-            scores = torch.load(cls.SCORES_FILE)
+            scores = cls._read()
             logger.success("Successfully loaded validator scores from file")
             return scores
         except Exception as e:
@@ -2,8 +2,6 @@ from collections import defaultdict
 from typing import Dict, List
 
 import numpy as np
-import pandas as pd
-import pingouin as pg
 import torch
 from attr import define, field
 from bittensor.utils.btlogging import logging as logger
@@ -156,12 +154,65 @@ def _get_ground_truth_by_criteria(criteria, model_with_score_sorted):
     return np.array(gt)
 
 
-def minmax_scale(tensor: torch.Tensor | np.ndarray) -> torch.Tensor:
-    if isinstance(tensor, np.ndarray):
-        tensor = torch.from_numpy(tensor)
-    min = tensor.min()
-    max = tensor.max()
-    return (tensor - min) / (max - min)
+def minmax_scale(
+    tensor: torch.Tensor | np.ndarray, axis: int | None = None
+) -> torch.Tensor:
+    """Scale values to the range [0, 1], constant inputs result in NaNs.
+
+    Computed in numpy, the inputs are tiny so torch dispatch overhead dominates.
+    If `axis` is given, each slice along it is scaled independently.
+    """
+    if isinstance(tensor, torch.Tensor):
+        tensor = tensor.detach().cpu().numpy()
+    arr = np.asarray(tensor)
+    lo = arr.min(axis=axis, keepdims=True)
+    hi = arr.max(axis=axis, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return torch.from_numpy((arr - lo) / (hi - lo))
+
+
+def _icc2_by_rater(ratings: np.ndarray, avg: np.ndarray) -> np.ndarray:
+    """ICC(2,1) of every rater against the average, in one batched pass.
+
+    Closed form two-way random effects ANOVA on each (num completions x 2)
+    table formed by a rater's column and `avg`, equivalent to the ICC2 row of
+    `pingouin.intraclass_corr`. All raters are evaluated at once with
+    vectorised numpy ops instead of one call per rater.
+
+    Args:
+        ratings (np.ndarray): 2D array of shape (num completions, num raters).
+        avg (np.ndarray): 1D array of the average rating per completion.
+
+    Returns:
+        np.ndarray: 1D array of ICC2 values, one per rater. Raters that match
+        the average exactly get 1.0; NaN only comes out when the rater and the
+        average are both constant, so the table has zero variance.
+    """
+    x = ratings.astype(np.float64)
+    y = avg.astype(np.float64)[:, None]
+    n, k = x.shape[0], 2
+
+    # shape (num completions, num raters)
+    row_means = (x + y) / 2
+    # shape (num raters,)
+    x_means = x.mean(axis=0)
+    y_means = y.mean(axis=0)
+    grand_means = row_means.mean(axis=0)
+
+    ss_rows = k * np.sum((row_means - grand_means) ** 2, axis=0)
+    ss_cols = n * ((x_means - grand_means) ** 2 + (y_means - grand_means) ** 2)
+    ss_error = np.sum(
+        (x - row_means - x_means + grand_means) ** 2
+        + (y - row_means - y_means + grand_means) ** 2,
+        axis=0,
+    )
+    ms_rows = ss_rows / (n - 1)
+    ms_cols = ss_cols / (k - 1)
+    ms_error = ss_error / ((n - 1) * (k - 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (ms_rows - ms_error) / (
+            ms_rows + (k - 1) * ms_error + k * (ms_cols - ms_error) / n
+        )
 
 
 class Scoring:
@@ -183,11 +234,9 @@ class Scoring:
         avg = None
         # shape (num miners, num completions)
         miner_outputs = None
-        icc_arr = []
 
         # for ordering based on criteria
         model_id_to_avg_rank = defaultdict(list)
-        model_id_to_scores = defaultdict(list)
 
         if isinstance(criteria, RankingCriteria):
             logger.debug("consensus scoring for ranking criteria")
@@ -221,16 +270,23 @@ class Scoring:
 
         elif isinstance(criteria, MultiScoreCriteria):
             logger.debug("consensus scoring for multi-score criteria")
-            # calculate average score per model
+            # calculate average score per model, indexing models in order of first
+            # appearance so sums and counts can be accumulated with bincount
+            model_id_to_idx: dict[str, int] = {}
+            model_idx, scores = [], []
             for response in miner_responses:
                 for completion in response.completion_responses:
-                    model_id_to_scores[completion.model].append(completion.score)
-            # for each model calculate the average score
+                    idx = model_id_to_idx.setdefault(
+                        completion.model, len(model_id_to_idx)
+                    )
+                    model_idx.append(idx)
+                    scores.append(completion.score)
+            model_idx = np.array(model_idx, dtype=np.intp)
+            avg_scores = np.bincount(
+                model_idx, weights=np.array(scores, dtype=np.float64)
+            ) / np.bincount(model_idx)
             # USE DICT BECAUSE WE NEED TO ENSURE CORRECT ORDERING
-            model_id_to_avg_score = {
-                model: sum(scores) / len(scores)
-                for model, scores in model_id_to_scores.items()
-            }
+            model_id_to_avg_score = dict(zip(model_id_to_idx, avg_scores.tolist()))
 
             # shape (num miners, num completions)
             # collect all scores from each miner based on ordering in model_id_avg_score
@@ -247,7 +303,7 @@ class Scoring:
                 ]
             )
 
-            avg: np.ndarray = np.array([v for k, v in model_id_to_avg_score.items()])
+            avg: np.ndarray = avg_scores
 
         else:
             raise NotImplementedError(
@@ -261,16 +317,12 @@ class Scoring:
         logger.info(f"Miner outputs {miner_outputs}")
         logger.info(f"Model id to avg {model_id_to_avg_score}")
 
-        # create df with the original number of completions
-        df = pd.DataFrame(
-            {
-                "subject": [i for i in range(len(request.completion_responses))],
-            }
-        )
-        # prepare dataframe for calculating ICC
+        # shape (num completions, num raters), keyed by hotkey so that a rater
+        # appearing twice only keeps its last scores
+        scores_by_rater: dict[str, list] = {}
         for response in miner_responses:
-            rater_id = response.axon.hotkey
-            ordered_scores = [
+            # order scores based on order in model_id_to_avg_score
+            scores_by_rater[response.axon.hotkey] = [
                 x.score
                 for x in sorted(
                     response.completion_responses,
@@ -281,35 +333,26 @@ class Scoring:
                     ),
                 )
             ]
-            # order scores based on order in model_id_to_avg_score
-            df[rater_id] = ordered_scores
-        rater_ids = list(df.columns)
-        rater_ids.remove("subject")
-        df["avg"] = df[rater_ids].mean(axis=1)
-
-        # this works because we are calculating ICC for each rater VS the avg
-        for rater_id in rater_ids:
-            try:
-                data_by_rater = df[["subject", rater_id, "avg"]]
-                # only use the columns for the current rater and avg
-                data_by_rater = data_by_rater.melt(
-                    id_vars=["subject"], var_name=rater_id, value_name="score"
-                )
-                icc = pg.intraclass_corr(
-                    data=data_by_rater,
-                    targets="subject",
-                    raters=rater_id,
-                    ratings="score",
-                )
+        rater_ids = list(scores_by_rater)
+        ratings = np.array(list(scores_by_rater.values()), dtype=np.float64).T
+        if ratings.shape[0] != len(request.completion_responses):
+            raise ValueError(
+                f"Expected {len(request.completion_responses)} ratings per rater, "
+                f"got {ratings.shape[0]}"
+            )
 
-                # take ICC(2,1)
-                icc2_value = icc[icc["Type"] == "ICC2"]["ICC"].iloc[0]
-                icc_arr.append(icc2_value)
+        # average per completion over the raters that gave a rating
+        is_rated = ~np.isnan(ratings)
+        row_sums = np.where(is_rated, ratings, 0.0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_ratings = row_sums / is_rated.sum(axis=1)
 
-            except Exception as e:
-                logger.error(f"Error calculating ICC for rater {rater_id}: {e}")
-                logger.debug(f"Data by rater: {data_by_rater}")
-                continue
+        # this works because we are calculating ICC for each rater VS the avg
+        # same preconditions as pingouin, at least 5 ratings and no missing values
+        is_valid_rater = is_rated.all(axis=0) & (ratings.shape[0] * 2 >= 5)
+        for rater_id in np.array(rater_ids)[~is_valid_rater]:
+            logger.error(f"Error calculating ICC for rater {rater_id}: invalid ratings")
+        icc_arr = _icc2_by_rater(ratings[:, is_valid_rater], avg_ratings)
 
         # already in the range [0, 1]
         icc_arr: torch.Tensor = torch.tensor(np.array(icc_arr))
@@ -387,13 +430,13 @@ class Scoring:
         logger.debug(f"scoring: cid with rank sorted\n{cid_with_rank_sorted}")
         # sort miner outputs according to ground truth order
         # we're using this because miners receive a shuffled order of the completions
-        cids_sorted = [cid for cid, _ in cid_with_rank_sorted]
+        cid_to_order = {cid: i for i, (cid, _) in enumerate(cid_with_rank_sorted)}
         miner_outputs = []
         for response in miner_responses:
             curr_miner_outputs = []
             for completion in sorted(
                 response.completion_responses,
-                key=lambda r: cids_sorted.index(r.model),
+                key=lambda r: cid_to_order[r.model],
             ):
                 curr_miner_outputs.append(
                     _get_miner_response_by_criteria(criteria, completion)
@@ -402,13 +445,13 @@ class Scoring:
         if miner_outputs == []:
             raise ValueError("Miner outputs cannot be empty")
 
-        if None in miner_outputs:
+        # None becomes NaN, so missing outputs are caught in a single vectorised check
+        miner_outputs = np.array(miner_outputs, dtype=np.float64)
+        if np.isnan(miner_outputs).any():
             raise ValueError("Miner outputs cannot contain None values")
-
-        miner_outputs = np.array(miner_outputs)
         logger.debug(f"scoring: raw miner outputs\n{miner_outputs}")
         # convert miner outputs to something ordinal
-        miner_outputs_normalised = np.array([minmax_scale(m) for m in miner_outputs])
+        miner_outputs_normalised = minmax_scale(miner_outputs, axis=1).numpy()
         logger.debug(
             f"scoring: raw miner outputs with nans\n{miner_outputs_normalised}"
         )
@@ -472,7 +515,9 @@ class Scoring:
         model_with_score_sorted = sorted(
             model_score_tuples, key=lambda x: (x[1] is not None, x[1]), reverse=True
         )
-        model_ids_sorted = [model[0] for model in model_with_score_sorted]
+        model_id_to_order = {
+            model_id: i for i, (model_id, _) in enumerate(model_with_score_sorted)
+        }
 
         # sort miner outputs according to ground truth order
         # this may be scores or ranks
@@ -487,7 +532,7 @@ class Scoring:
             curr_miner_outputs = []
             for completion in sorted(
                 response.completion_responses,
-                key=lambda r: model_ids_sorted.index(r.model),
+                key=lambda r: model_id_to_order[r.model],
             ):
                 curr_miner_outputs.append(
                     _get_miner_response_by_criteria(criteria, completion)
@@ -496,11 +541,11 @@ class Scoring:
         if miner_outputs == []:
             raise ValueError("Miner outputs cannot be empty")
 
-        if None in miner_outputs:
+        # None becomes NaN, so missing outputs are caught in a single vectorised check
+        miner_outputs = np.array(miner_outputs, dtype=np.float64)
+        if np.isnan(miner_outputs).any():
             raise ValueError("Miner outputs cannot contain None values")
 
-        miner_outputs = np.array(miner_outputs)
-
         # this may be scores or ranks
         ground_truth = _get_ground_truth_by_criteria(criteria, model_with_score_sorted)
 
@@ -526,7 +571,7 @@ class Scoring:
         Calculate Spearman Correlation between miner outputs and ground truth using 'cid'.
         """
 
-        gt_keys = list(request.ground_truth.keys())
+        gt_key_to_order = {key: i for i, key in enumerate(request.ground_truth)}
         gt_values = list(request.ground_truth.values())
 
         # Gather miner outputs based on their responses
@@ -535,7 +580,7 @@ class Scoring:
             curr_miner_outputs = []
             for completion in sorted(
                 response.completion_responses,
-                key=lambda response: gt_keys.index(response.completion_id),
+                key=lambda response: gt_key_to_order[response.completion_id],
             ):
                 curr_miner_outputs.append(
                     _get_miner_response_by_criteria(criteria, completion)
@@ -571,58 +616,74 @@ class Scoring:
         logger.trace(
             f"Calculating scores for miner responses ... {len(miner_responses)}"
         )
+        # miner outputs only depend on the type of criteria, so criteria of the
+        # same type share the filtered responses and ground truth scores
+        scored_by_criteria_type: dict[
+            type, tuple[List[FeedbackRequest], torch.Tensor]
+        ] = {}
         for criteria in criteria_types:
-            # valid responses
-            valid_miner_responses = []
-            for response in miner_responses:
-                values = [
-                    _get_miner_response_by_criteria(criteria, completion)
-                    for completion in response.completion_responses
+            if type(criteria) in scored_by_criteria_type:
+                valid_miner_responses, gt_score = scored_by_criteria_type[
+                    type(criteria)
                 ]
-                if any(v is None for v in values):
-                    continue
-                valid_miner_responses.append(response)
-
-            if not len(valid_miner_responses):
-                logger.info(f"📝 No valid responses for {request.request_id}")
-
-                for r in miner_responses:
-                    hotkey_to_final_score[r.axon.hotkey] = 0.0  # type: ignore
-                consensus_score = ConsensusScore(
-                    score=torch.zeros(len(miner_responses)),
-                    mse_by_miner=torch.zeros(len(miner_responses)),
-                    icc_by_miner=torch.zeros(len(miner_responses)),
-                )
+            else:
+                # valid responses
+                valid_miner_responses = []
+                for response in miner_responses:
+                    values = [
+                        _get_miner_response_by_criteria(criteria, completion)
+                        for completion in response.completion_responses
+                    ]
+                    if any(v is None for v in values):
+                        continue
+                    valid_miner_responses.append(response)
+
+                if not len(valid_miner_responses):
+                    logger.info(f"📝 No valid responses for {request.request_id}")
+
+                    for r in miner_responses:
+                        hotkey_to_final_score[r.axon.hotkey] = 0.0  # type: ignore
+                    consensus_score = ConsensusScore(
+                        score=torch.zeros(len(miner_responses)),
+                        mse_by_miner=torch.zeros(len(miner_responses)),
+                        icc_by_miner=torch.zeros(len(miner_responses)),
+                    )
 
-                criteria_to_miner_scores[criteria.type] = Score(
-                    ground_truth=torch.zeros(len(miner_responses)),
-                    consensus=consensus_score,
-                )
-                return criteria_to_miner_scores, hotkey_to_final_score
+                    criteria_to_miner_scores[criteria.type] = Score(
+                        ground_truth=torch.zeros(len(miner_responses)),
+                        consensus=consensus_score,
+                    )
+                    return criteria_to_miner_scores, hotkey_to_final_score
 
-            # if len(valid_miner_responses) < 2:
-            #     logger.warning(
-            #         f"Skipping scoring for request id: {request.request_id} as not enough valid responses"
-            #     )
-            #     for r in valid_miner_responses:
-            #         hotkey_to_final_score[r.axon.hotkey] = 0.0
+                # if len(valid_miner_responses) < 2:
+                #     logger.warning(
+                #         f"Skipping scoring for request id: {request.request_id} as not enough valid responses"
+                #     )
+                #     for r in valid_miner_responses:
+                #         hotkey_to_final_score[r.axon.hotkey] = 0.0
 
-            #     continue
+                #     continue
 
-            # # if isinstance(criteria, RankingCriteria):
-            # #     gt_score = Scoring.spm_ground_truth(
-            # #         criteria, request, valid_miner_responses
-            # #     )
+                # # if isinstance(criteria, RankingCriteria):
+                # #     gt_score = Scoring.spm_ground_truth(
+                # #         criteria, request, valid_miner_responses
+                # #     )
 
-            logger.info(
-                f"📝 Filtered {len(valid_miner_responses)} valid responses for request id {request.request_id}"
-            )
+                logger.info(
+                    f"📝 Filtered {len(valid_miner_responses)} valid responses for request id {request.request_id}"
+                )
 
-            if not isinstance(criteria, MultiScoreCriteria):
-                raise NotImplementedError("Only multi-score criteria is supported atm")
-            gt_score = Scoring.ground_truth_score_V1(
-                criteria, request.ground_truth, valid_miner_responses
-            )
+                if not isinstance(criteria, MultiScoreCriteria):
+                    raise NotImplementedError(
+                        "Only multi-score criteria is supported atm"
+                    )
+                gt_score = Scoring.ground_truth_score_V1(
+                    criteria, request.ground_truth, valid_miner_responses
+                )
+                scored_by_criteria_type[type(criteria)] = (
+                    valid_miner_responses,
+                    gt_score,
+                )
 
             # TODO @dev add heuristics once scoring is stable
             # consensus_score = Scoring.consensus_score(
@@ -1,5 +1,6 @@
 import copy
 import os
+import sys
 import time
 import uuid
 from collections import OrderedDict
@@ -30,11 +31,15 @@ def _terminal_plot(
     Args:
         title (str): Title of the plot.
         y (np.ndarray): Y values to plot.
-        x (np.ndarray | None, optional): X values to plot. If None, will use a np.linspace from 0 to len(y).
+        x (np.ndarray | None, optional): X values to plot. If None, will use np.arange(len(y)).
         sort (bool, optional): Whether to sort the y values. Defaults to False.
     """
+    # the ANSI canvas is just noise when output is piped to a log file
+    if not sys.stdout.isatty():
+        return
+
     if x is None:
-        x = np.linspace(0, len(y), len(y) + 1)
+        x = np.arange(len(y))
 
     if sort:
         y_copy = np.copy(y)
@@ -69,11 +74,16 @@ def get_epoch_time():
 
 
 def datetime_as_utc(dt: datetime) -> datetime:
-    return dt.replace(tzinfo=timezone.utc)
+    # naive datetimes are stored as UTC, aware ones are converted rather than relabelled
+    if dt.tzinfo is timezone.utc:
+        return dt
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
 def datetime_to_iso8601_str(dt: datetime) -> str:
-    return dt.replace(tzinfo=timezone.utc).isoformat()
+    return datetime_as_utc(dt).isoformat()
 
 
 def iso8601_str_to_datetime(dt_str: str) -> datetime:
@@ -385,11 +395,8 @@ def set_expire_time(expire_in_seconds: int) -> str:
     Returns:
         str: The expiration time in ISO 8601 format with 'Z' as the UTC indicator.
     """
-    return (
-        (datetime.now(timezone.utc) + timedelta(seconds=expire_in_seconds))
-        .replace(tzinfo=timezone.utc)
-        .isoformat()
-        .replace("+00:00", "Z")
+    return (datetime.now(timezone.utc) + timedelta(seconds=expire_in_seconds)).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
     )
 
 
@@ -1,7 +1,8 @@
-import json
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 
 import bittensor as bt
+import orjson
 from loguru import logger
 
 from commons.exceptions import (
@@ -50,7 +51,7 @@ def map_criteria_type_to_model(
                 type=CriteriaTypeEnum.RANKING_CRITERIA,
                 feedback_request_id=feedback_request_id,  # this is parent_id
                 # options=cast(Json, json.dumps(criteria.options)),
-                options=Json(json.dumps(criteria.options)),
+                options=Json(orjson.dumps(criteria.options).decode()),
             )
         elif isinstance(criteria, ScoreCriteria):
             return Criteria_Type_ModelCreateInput(
@@ -58,19 +59,19 @@ def map_criteria_type_to_model(
                 feedback_request_id=feedback_request_id,
                 min=criteria.min,
                 max=criteria.max,
-                options=Json(json.dumps([])),
+                options=Json("[]"),
             )
         elif isinstance(criteria, MultiSelectCriteria):
             return Criteria_Type_ModelCreateInput(
                 type=CriteriaTypeEnum.MULTI_SELECT,
                 feedback_request_id=feedback_request_id,
-                options=Json(json.dumps(criteria.options)),
+                options=Json(orjson.dumps(criteria.options).decode()),
             )
         elif isinstance(criteria, MultiScoreCriteria):
             return Criteria_Type_ModelCreateInput(
                 type=CriteriaTypeEnum.MULTI_SCORE,
                 feedback_request_id=feedback_request_id,
-                options=Json(json.dumps(criteria.options)),
+                options=Json(orjson.dumps(criteria.options).decode()),
                 min=criteria.min,
                 max=criteria.max,
             )
@@ -80,13 +81,21 @@ def map_criteria_type_to_model(
         raise ValueError(f"Failed to map criteria type to model {e}")
 
 
+@lru_cache(maxsize=1024)
+def _parse_criteria_options(options: str) -> tuple[str, ...]:
+    """Every miner response of a task stores the same criteria options, so parse
+    each distinct JSON string once. Returns a tuple so the cached value can't be
+    mutated, pydantic copies it into a fresh list on validation."""
+    return tuple(orjson.loads(options))
+
+
 def map_criteria_type_model_to_criteria_type(
     model: Criteria_Type_Model,
 ) -> CriteriaType:
     try:
         if model.type == CriteriaTypeEnum.RANKING_CRITERIA:
             return RankingCriteria(
-                options=json.loads(model.options) if model.options else []
+                options=_parse_criteria_options(model.options) if model.options else []
             )
         elif model.type == CriteriaTypeEnum.SCORE:
             return ScoreCriteria(
@@ -95,11 +104,11 @@ def map_criteria_type_model_to_criteria_type(
             )
         elif model.type == CriteriaTypeEnum.MULTI_SELECT:
             return MultiSelectCriteria(
-                options=json.loads(model.options) if model.options else []
+                options=_parse_criteria_options(model.options) if model.options else []
             )
         elif model.type == CriteriaTypeEnum.MULTI_SCORE:
             return MultiScoreCriteria(
-                options=json.loads(model.options) if model.options else [],
+                options=_parse_criteria_options(model.options) if model.options else [],
                 min=model.min if model.min is not None else 0.0,
                 max=model.max if model.max is not None else 0.0,
             )
@@ -116,7 +125,7 @@ def map_completion_response_to_model(
     result = Completion_Response_ModelCreateInput(
         completion_id=response.completion_id,
         model=response.model,
-        completion=Json(json.dumps(response.completion, default=vars)),
+        completion=Json(orjson.dumps(response.completion, default=vars).decode()),
         rank_id=response.rank_id,
         score=response.score,
         feedback_request_id=feedback_request_id,
@@ -210,7 +219,7 @@ def map_feedback_request_model_to_feedback_request(
             CompletionResponses(
                 completion_id=completion.completion_id,
                 model=completion.model,
-                completion=json.loads(completion.completion),
+                completion=orjson.loads(completion.completion),
                 rank_id=completion.rank_id,
                 score=completion.score,
             )
@@ -253,3 +262,9 @@ def map_feedback_request_model_to_feedback_request(
         raise ValueError(
             f"Failed to map Feedback_Request_Model to FeedbackRequest: {e}"
         )
+
+
+# bound once at import instead of building a lambda per validator request
+map_miner_response_model_to_feedback_request = partial(
+    map_feedback_request_model_to_feedback_request, is_miner=True
+)
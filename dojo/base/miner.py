@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import threading
 import traceback
 
@@ -68,6 +69,12 @@ class BaseMinerNeuron(BaseNeuron):
                 # Sync metagraph and potentially set weights.
                 self.sync()
                 self.step += 1
+                # collect while idle between syncs rather than mid request, young
+                # generations every step and a full collection every 100 steps
+                if self.step % 100 == 0:
+                    gc.collect()
+                else:
+                    gc.collect(1)
                 await asyncio.sleep(12)
 
         # If someone intentionally stops the miner, it'll safely terminate operations.
@@ -35,7 +35,7 @@ class RankingCriteria(BaseModel):
 
     type: str = CriteriaTypeEnum.RANKING_CRITERIA.value
     options: List[str] = Field(
-        description="List of options human labeller will see", default=[]
+        description="List of options human labeller will see", default_factory=list
     )
 
 
@@ -52,7 +52,7 @@ class MultiSelectCriteria(BaseModel):
 
     type: str = CriteriaTypeEnum.MULTI_SELECT.value
     options: List[str] = Field(
-        description="List of options human labeller will see", default=[]
+        description="List of options human labeller will see", default_factory=list
     )
 
 
@@ -61,7 +61,7 @@ class MultiScoreCriteria(BaseModel):
 
     type: str = CriteriaTypeEnum.MULTI_SCORE.value
     options: List[str] = Field(
-        default=[], description="List of options human labeller will see"
+        default_factory=list, description="List of options human labeller will see"
     )
     min: float = Field(description="Minimum score for the task")
     max: float = Field(description="Maximum score for the task")
@@ -112,21 +112,21 @@ class SyntheticQA(BaseModel):
     @model_validator(mode="after")
     def verify_completion_ids(self):
         completion_ids = {resp.completion_id for resp in self.responses}
-        ground_truth_keys = set(self.ground_truth.keys())
+        ground_truth_keys = self.ground_truth.keys()
+        # happy path is a single set comparison, differences only on mismatch
+        if completion_ids == ground_truth_keys:
+            return self
 
-        if not completion_ids.issubset(ground_truth_keys):
-            missing_ids = completion_ids - ground_truth_keys
+        missing_ids = completion_ids - ground_truth_keys
+        if missing_ids:
             raise ValueError(
                 f"The following completion_ids are missing from ground_truth: {missing_ids}"
             )
 
-        if not ground_truth_keys.issubset(completion_ids):
-            extra_keys = ground_truth_keys - completion_ids
-            raise ValueError(
-                f"The following keys in ground_truth do not correspond to any completion_id: {extra_keys}"
-            )
-
-        return self
+        extra_keys = ground_truth_keys - completion_ids
+        raise ValueError(
+            f"The following keys in ground_truth do not correspond to any completion_id: {extra_keys}"
+        )
 
 
 class FeedbackRequest(bt.Synapse):
@@ -205,5 +205,5 @@ class TaskResult(BaseModel):
 class TaskResultRequest(bt.Synapse):
     task_id: str = Field(description="The ID of the task to retrieve results for")
     task_results: list[TaskResult] = Field(
-        description="List of TaskResult objects", default=[]
+        description="List of TaskResult objects", default_factory=list
     )
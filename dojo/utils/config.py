@@ -3,6 +3,7 @@ import inspect
 import logging
 import os
 import site
+import sys
 from functools import lru_cache
 from pathlib import Path
 
@@ -81,9 +82,9 @@ def check_config(config: bt.config):
     full_path = os.path.expanduser(
         f"{log_dir}/{config.wallet.name}/{config.wallet.hotkey}/netuid{config.netuid}/{config.neuron.name}"
     )
-    config.neuron.full_path = os.path.expanduser(full_path)
-    if not os.path.exists(config.neuron.full_path):
-        os.makedirs(config.neuron.full_path, exist_ok=True)
+    config.neuron.full_path = full_path
+    # exist_ok already tolerates an existing directory, no separate stat needed
+    Path(full_path).mkdir(parents=True, exist_ok=True)
 
     # bt.logging.enable_third_party_loggers()
 
@@ -108,14 +109,25 @@ def configure_logging(config: bt.config):
     # Optionally enable file logging if `record_log` and `logging_dir` are provided
     if config.record_log and config.logging_dir:
         logging_dir = os.path.expanduser(config.logging_dir)
-        if not os.path.exists(logging_dir):
-            os.makedirs(logging_dir, exist_ok=True)
+        Path(logging_dir).mkdir(parents=True, exist_ok=True)
 
         bt.logging.set_config(config)
 
     apply_custom_logging_format()
 
 
+def _get_argv_value(flag: str) -> str | None:
+    """Value passed for `flag` on the command line, read straight from sys.argv
+    instead of running a full argparse pass just to peek at a single option."""
+    argv = sys.argv[1:]
+    for i, arg in enumerate(argv):
+        if arg == flag:
+            return argv[i + 1] if i + 1 < len(argv) else None
+        if arg.startswith(f"{flag}="):
+            return arg[len(flag) + 1 :]
+    return None
+
+
 def add_args(parser):
     """
     Adds relevant arguments to the parser for operation.
@@ -130,10 +142,7 @@ def add_args(parser):
         type=str,
         help="Whether running a miner or validator",
     )
-    args, _ = parser.parse_known_args()
-    neuron_type = None
-    if known_args := vars(args):
-        neuron_type = known_args["neuron.type"]
+    neuron_type = _get_argv_value("--neuron.type")
 
     parser.add_argument(
         "--neuron.name",
@@ -190,11 +199,7 @@ def add_args(parser):
         help="Set miner simluation to a bad one",
     )
 
-    epoch_length = 100
-    known_args, _ = parser.parse_known_args()
-    if known_args := vars(known_args):
-        if known_args["fast_mode"]:
-            epoch_length = 10
+    epoch_length = 10 if "--fast_mode" in sys.argv[1:] else 100
 
     parser.add_argument(
         "--neuron.epoch_length",
@@ -251,10 +256,22 @@ def get_config():
 
 
 def source_dotenv():
-    """Source env file if provided"""
+    """Source env file if provided, DOJO_ENV_FILE takes precedence over --env_file"""
+    # checked first so simple env loads don't have to build the argparse config
+    if env_file := os.getenv("DOJO_ENV_FILE"):
+        load_dotenv(env_file, override=True)
+        logger.trace(f"Sourcing env vars from {env_file}")
+        return
+
     config = get_config()
     if config.env_file:
-        load_dotenv(find_dotenv(config.env_file), override=True)
+        # find_dotenv walks up parent directories, only needed for relative paths
+        env_file = (
+            config.env_file
+            if os.path.isabs(config.env_file)
+            else find_dotenv(config.env_file)
+        )
+        load_dotenv(env_file, override=True)
         logger.trace(f"Sourcing env vars from {config.env_file}")
         return
 
@@ -5,10 +5,29 @@ from collections import defaultdict
 from typing import List
 
 import bittensor as bt
+import numpy as np
 import torch
 from bittensor.utils.btlogging import logging as logger
 
 from commons.utils import keccak256_hash
+from dojo import VALIDATOR_MIN_STAKE
+
+
+# hotkey -> uid lookup for the last metagraph.hotkeys list seen, a metagraph
+# sync rebinds that list so an identity check is enough to tell it changed
+_hotkey_to_uid: dict[str, int] = {}
+_hotkey_to_uid_source: list[str] | None = None
+
+
+def get_hotkey_to_uid(metagraph: bt.metagraph) -> dict[str, int]:
+    """Mapping of hotkey to uid for the metagraph, so lookups are O(1) instead of
+    scanning `metagraph.hotkeys` with `list.index`."""
+    global _hotkey_to_uid, _hotkey_to_uid_source
+    hotkeys = metagraph.hotkeys
+    if _hotkey_to_uid_source is not hotkeys:
+        _hotkey_to_uid = {hotkey: uid for uid, hotkey in enumerate(hotkeys)}
+        _hotkey_to_uid_source = hotkeys
+    return _hotkey_to_uid
 
 
 def get_all_serving_uids(metagraph: bt.metagraph):
@@ -26,19 +45,14 @@ def is_uid_available(metagraph: bt.metagraph, uid: int) -> bool:
 
 def is_miner(metagraph: bt.metagraph, uid: int) -> bool:
     """Check if uid is a validator."""
-    stakes = metagraph.S.tolist()
-    from dojo import VALIDATOR_MIN_STAKE
-
-    return stakes[uid] < VALIDATOR_MIN_STAKE
+    # index the stake directly, converting the whole stake array to a list
+    # on every call is O(n) per check
+    return float(metagraph.S[uid]) < VALIDATOR_MIN_STAKE
 
 
 def get_random_miner_uids(metagraph: bt.metagraph, k: int) -> torch.LongTensor:
     """Returns k available random uids from the metagraph."""
-    avail_uids = []
-
-    for uid in range(metagraph.n.item()):
-        if metagraph.axons[uid].is_serving and is_miner(metagraph, uid):
-            avail_uids.append(uid)
+    avail_uids = extract_miner_uids(metagraph)
 
     # Check if candidate_uids contain enough for querying, if not grab all available uids
     logger.info(f"available uids: {avail_uids}")
@@ -54,11 +68,15 @@ def get_random_miner_uids(metagraph: bt.metagraph, k: int) -> torch.LongTensor:
 
 
 def extract_miner_uids(metagraph: bt.metagraph):
-    uids = [
-        uid
-        for uid in range(metagraph.n.item())
-        if metagraph.axons[uid].is_serving and is_miner(metagraph, uid)
-    ]
+    # one stake comparison for the whole metagraph rather than `is_miner` per uid,
+    # combined with the serving flags as a mask so uids are selected in one pass
+    miner_mask = np.asarray(metagraph.S) < VALIDATOR_MIN_STAKE
+    serving_mask = np.fromiter(
+        (axon.is_serving for axon in metagraph.axons),
+        dtype=bool,
+        count=len(metagraph.axons),
+    )
+    uids = np.flatnonzero(miner_mask & serving_mask).tolist()
     return uids
 
 
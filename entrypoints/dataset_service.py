@@ -1,5 +1,7 @@
 import asyncio
 import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import List
 
 import aioboto3
@@ -8,14 +10,32 @@ import bittensor as bt
 import httpx
 import uvicorn
 from bittensor.utils.btlogging import logging as logger
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from substrateinterface import Keypair
 
+from commons import crypto
+from commons.api.responses import ORJSONModelResponse
 from commons.objects import ObjectManager
 from dojo import VALIDATOR_MIN_STAKE
 
-app = FastAPI(title="Dataset Upload Service")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # one session and s3 resource for the lifetime of the service, instead of
+    # rebuilding the boto client and its connection pool on every upload
+    session = aioboto3.Session(region_name=AWS_REGION)
+    async with session.resource("s3", config=BotoConfig(max_pool_connections=50)) as s3:
+        app.state.bucket = await s3.Bucket(BUCKET_NAME)
+        yield
+
+
+app = FastAPI(
+    title="Dataset Upload Service",
+    default_response_class=ORJSONModelResponse,
+    lifespan=lifespan,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -26,18 +46,32 @@ app.add_middleware(
 config = ObjectManager.get_config()
 subtensor = bt.subtensor(config=config)
 metagraph = subtensor.metagraph(netuid=52, lite=True)
+# the metagraph is only synced once at startup, so index its hotkeys once too
+hotkey_to_uid = {hotkey: uid for uid, hotkey in enumerate(metagraph.hotkeys)}
 AWS_REGION = os.getenv("AWS_REGION")
 BUCKET_NAME = os.getenv("S3_BUCKET_NAME")
 MAX_CHUNK_SIZE_MB = int(os.getenv("MAX_CHUNK_SIZE_MB", 50))
+# anything above 16MiB goes up as concurrent 16MiB multipart parts
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+)
 
 
 def verify_hotkey_in_metagraph(hotkey: str) -> bool:
-    return hotkey in metagraph.hotkeys
+    return hotkey in hotkey_to_uid
+
+
+@lru_cache(maxsize=4096)
+def _verify_signature_cached(hotkey: str, signature: str, message: str) -> bool:
+    """Keyed on the full (hotkey, signature, message) tuple, so replayed uploads
+    skip the ss58 decode and the sr25519 verify."""
+    return crypto.verify(crypto.get_public_key(hotkey), message, signature)
 
 
 def verify_signature(hotkey: str, signature: str, message: str) -> bool:
-    keypair = Keypair(ss58_address=hotkey, ss58_format=42)
-    if not keypair.verify(data=message, signature=signature):
+    if not _verify_signature_cached(hotkey, signature, message):
         logger.error(f"Invalid signature for address={hotkey}")
         return False
 
@@ -46,10 +80,8 @@ def verify_signature(hotkey: str, signature: str, message: str) -> bool:
 
 
 def check_stake(hotkey: str) -> bool:
-    uid = -1
-    try:
-        uid = metagraph.hotkeys.index(hotkey)
-    except ValueError:
+    uid = hotkey_to_uid.get(hotkey)
+    if uid is None:
         logger.error(f"Hotkey {hotkey} not found in metagraph")
         return False
 
@@ -79,8 +111,9 @@ async def upload_dataset(
                 status_code=401, detail="Invalid signature format, must be hex."
             )
 
-        if not verify_signature(hotkey, signature, message):
-            logger.error(f"Invalid signature for address={hotkey}")
+        # verify_signature already logs the outcome, the sr25519 verify is CPU
+        # bound so run it off the event loop to keep other uploads responsive
+        if not await asyncio.to_thread(verify_signature, hotkey, signature, message):
             raise HTTPException(status_code=401, detail="Invalid signature.")
 
         if not verify_hotkey_in_metagraph(hotkey):
@@ -95,24 +128,21 @@ async def upload_dataset(
                 status_code=401, detail="Insufficient stake for hotkey."
             )
 
-        session = aioboto3.Session(region_name=AWS_REGION)
-        async with session.resource("s3") as s3:
-            bucket = await s3.Bucket(BUCKET_NAME)
-            for file in files:
-                content = await file.read()
-                file_size = len(content)
-                if file_size > MAX_CHUNK_SIZE_MB * 1024 * 1024:  # 50MB in bytes
-                    raise HTTPException(
-                        status_code=413,
-                        detail=f"File too large. Maximum size is {MAX_CHUNK_SIZE_MB}MB",
-                    )
-
-                filename = f"hotkey_{hotkey}_{file.filename}"
-
-                await bucket.put_object(
-                    Key=filename,
-                    Body=content,
+        bucket = app.state.bucket
+        for file in files:
+            # size is known from multipart parsing, so oversized files are
+            # rejected without reading them into memory
+            if file.size > MAX_CHUNK_SIZE_MB * 1024 * 1024:  # 50MB in bytes
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {MAX_CHUNK_SIZE_MB}MB",
                 )
+
+            filename = f"hotkey_{hotkey}_{file.filename}"
+
+            # stream from the spooled upload file instead of holding a
+            # second full copy of the payload as bytes
+            await bucket.upload_fileobj(file.file, filename, Config=S3_TRANSFER_CONFIG)
     except Exception as e:
         logger.error(f"Error uploading dataset: {e}")
         raise HTTPException(status_code=500, detail=f"Error uploading dataset: {e}")
@@ -1,19 +1,43 @@
 import asyncio
+import gc
+import sys
 
 from bittensor.utils.btlogging import logging as logger
 
+from commons.human_feedback.dojo import DojoAPI
 from commons.objects import ObjectManager
 from dojo.utils.config import source_dotenv
 
 source_dotenv()
 
+# libuv based event loop for every loop created from here on, including the one
+# the validator/miner uses during construction, uvloop doesn't support windows
+if sys.platform != "win32":
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 async def main():
     miner = ObjectManager.get_miner()
-    log_task = asyncio.create_task(miner.log_miner_status())
-    run_task = asyncio.create_task(miner.run())
-
-    await asyncio.gather(log_task, run_task)
+    # startup objects live for the whole process, keep them out of gc scans
+    gc.collect()
+    gc.freeze()
+    # 16x the default thresholds, the run loop collects between syncs instead
+    gc.set_threshold(11200, 160, 160)
+    running_tasks = [
+        asyncio.create_task(miner.log_miner_status()),
+        asyncio.create_task(miner.run()),
+    ]
+
+    try:
+        await asyncio.gather(*running_tasks)
+    finally:
+        # if one task fails or we are cancelled, don't leave the other running
+        for task in running_tasks:
+            task.cancel()
+        await asyncio.gather(*running_tasks, return_exceptions=True)
+        await DojoAPI.close_session()
     logger.info("Exiting main function.")
 
 
@@ -1,4 +1,6 @@
 import asyncio
+import gc
+import sys
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -8,6 +10,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from commons.api.middleware import LimitContentLengthMiddleware
+from commons.api.responses import ORJSONModelResponse
 from commons.api.reward_route import reward_router
 from commons.dataset.synthetic import SyntheticAPI
 from commons.objects import ObjectManager
@@ -16,6 +19,13 @@ from dojo.utils.config import source_dotenv
 
 source_dotenv()
 
+# libuv based event loop for every loop created from here on, including the one
+# the validator/miner uses during construction, uvloop doesn't support windows
+if sys.platform != "win32":
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 validator = ObjectManager.get_validator()
 
 
@@ -23,9 +33,34 @@ validator = ObjectManager.get_validator()
 async def lifespan(app: FastAPI):
     logger.info("Performing startup tasks...")
     await connect_db()
+    # everything allocated so far (modules, the validator, metagraph) lives for the
+    # whole process, move it out of the tracked generations so full collections
+    # don't keep rescanning it
+    gc.collect()
+    gc.freeze()
+    # 16x the default thresholds, the run loop collects in its idle window instead
+    # of letting collections fire in the middle of requests
+    gc.set_threshold(11200, 160, 160)
+    running_tasks = [
+        asyncio.create_task(validator.log_validator_status()),
+        asyncio.create_task(validator.run()),
+        asyncio.create_task(validator.update_score_and_send_feedback()),
+        asyncio.create_task(validator.send_heartbeats()),
+    ]
     yield
     logger.info("Performing shutdown tasks...")
     validator._should_exit = True
+    # stop the background loops before closing what they depend on, so nothing
+    # is still hitting the db or subtensor once they are torn down below
+    for task in running_tasks:
+        task.cancel()
+    results = await asyncio.gather(*running_tasks, return_exceptions=True)
+    for task, result in zip(running_tasks, results):
+        if isinstance(result, asyncio.CancelledError):
+            logger.info(f"Cancelled task {task.get_name()}")
+        elif isinstance(result, Exception):
+            logger.error(f"Task {task.get_name()} raised an exception: {result}")
+
     validator.executor.shutdown(wait=True)
     validator.subtensor.substrate.close()
     wandb.finish()
@@ -34,7 +69,7 @@ async def lifespan(app: FastAPI):
     await disconnect_db()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONModelResponse)
 app.add_middleware(
     CORSMiddleware,
 )
@@ -52,25 +87,8 @@ async def main():
         reload=False,
     )
     server = uvicorn.Server(config)
-    running_tasks = [
-        asyncio.create_task(validator.log_validator_status()),
-        asyncio.create_task(validator.run()),
-        asyncio.create_task(validator.update_score_and_send_feedback()),
-        asyncio.create_task(validator.send_heartbeats()),
-    ]
-
+    # background tasks are started and cancelled by the app's lifespan
     await server.serve()
-
-    for task in running_tasks:
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            logger.info(f"Cancelled task {task.get_name()}")
-        except Exception as e:
-            logger.error(f"Task {task.get_name()} raised an exception: {e}")
-            pass
-
     logger.info("Exiting main function.")
 
 
@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import threading
 import time
 import traceback
@@ -15,7 +14,7 @@ from dojo import MINER_STATUS, VALIDATOR_MIN_STAKE
 from dojo.base.miner import BaseMinerNeuron
 from dojo.protocol import FeedbackRequest, Heartbeat, ScoringResult, TaskResultRequest
 from dojo.utils.config import get_config
-from dojo.utils.uids import is_miner
+from dojo.utils.uids import get_hotkey_to_uid, is_miner
 
 
 class Miner(BaseMinerNeuron):
@@ -150,7 +149,8 @@ class Miner(BaseMinerNeuron):
         logger.info("checking blacklist function")
 
         caller_hotkey = synapse.dendrite.hotkey
-        if caller_hotkey is None or caller_hotkey not in self.metagraph.hotkeys:
+        hotkey_to_uid = get_hotkey_to_uid(self.metagraph)
+        if caller_hotkey is None or caller_hotkey not in hotkey_to_uid:
             # Ignore requests from unrecognized entities.
             logger.warning(
                 f"Blacklisting unrecognized hotkey {synapse.dendrite.hotkey}"
@@ -159,7 +159,7 @@ class Miner(BaseMinerNeuron):
 
         logger.debug(f"Got request from {caller_hotkey}")
 
-        caller_uid = self.metagraph.hotkeys.index(caller_hotkey)
+        caller_uid = hotkey_to_uid[caller_hotkey]
         validator_neuron: bt.NeuronInfo = self.metagraph.neurons[caller_uid]
 
         if get_config().ignore_min_stake:
@@ -197,14 +197,15 @@ class Miner(BaseMinerNeuron):
         return priority
 
     def resync_metagraph(self):
-        # Copies state of metagraph before syncing.
-        previous_metagraph = copy.deepcopy(self.metagraph)
+        # Only the axons are compared after syncing, and sync rebinds the list,
+        # so a shallow copy is enough instead of a full deepcopy.
+        previous_axons = list(self.metagraph.axons)
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
 
         # Check if the metagraph axon info has changed.
-        if previous_metagraph.axons == self.metagraph.axons:
+        if previous_axons == self.metagraph.axons:
             return
 
         logger.info("Metagraph updated")
@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import gc
 import math
 import random
@@ -18,7 +17,6 @@ import torch
 import wandb
 from bittensor.utils.btlogging import logging as logger
 from bittensor.utils.weight_utils import process_weights_for_netuid
-from fastapi.encoders import jsonable_encoder
 from tenacity import RetryError
 from torch.nn import functional as F
 from websocket import create_connection
@@ -60,7 +58,7 @@ from dojo.protocol import (
     TaskType,
 )
 from dojo.utils.config import get_config
-from dojo.utils.uids import MinerUidSelector, extract_miner_uids, is_miner
+from dojo.utils.uids import MinerUidSelector, extract_miner_uids, get_hotkey_to_uid
 
 
 class Validator:
@@ -69,6 +67,8 @@ class Validator:
     _uids_alock = asyncio.Lock()
     _request_alock = asyncio.Lock()
     _threshold = 0.1
+    # max miner task result queries in flight while updating task completions
+    _miner_query_limit: int = 30
     _active_miner_uids: set[int] = set()
 
     subtensor: bt.subtensor
@@ -125,7 +125,8 @@ class Validator:
 
     async def send_scores(self, synapse: ScoringResult, hotkeys: List[str]):
         """Send consensus score back to miners who participated in the request."""
-        axons = [axon for axon in self.metagraph.axons if axon.hotkey in hotkeys]
+        hotkeys_set = set(hotkeys)
+        axons = [axon for axon in self.metagraph.axons if axon.hotkey in hotkeys_set]
         if not axons:
             logger.warning("No axons to send consensus to... skipping")
         else:
@@ -158,17 +159,17 @@ class Validator:
             try:
                 all_miner_uids = extract_miner_uids(metagraph=self.metagraph)
                 logger.debug(f"Sending heartbeats to {len(all_miner_uids)} miners")
+                own_hotkey = self.wallet.hotkey.ss58_address.casefold()
                 axons: list[bt.AxonInfo] = [
                     self.metagraph.axons[uid]
                     for uid in all_miner_uids
-                    if self.metagraph.axons[uid].hotkey.casefold()
-                    != self.wallet.hotkey.ss58_address.casefold()
+                    if self.metagraph.axons[uid].hotkey.casefold() != own_hotkey
                 ]
 
                 responses: List[Heartbeat] = await self.dendrite.forward(  # type: ignore
                     axons=axons, synapse=Heartbeat(), deserialize=False, timeout=30
                 )
-                active_hotkeys = [r.axon.hotkey for r in responses if r.ack and r.axon]
+                active_hotkeys = {r.axon.hotkey for r in responses if r.ack and r.axon}
                 active_uids = [
                     uid
                     for uid, axon in enumerate(self.metagraph.axons)
@@ -475,6 +476,8 @@ class Validator:
                     traceback.print_exc()
                     logger.error(f"Error during validator run: {e}")
                     pass
+                # the request cycle is done, collect its garbage before going idle
+                gc.collect(1)
                 await asyncio.sleep(dojo.VALIDATOR_RUN)
 
         # If someone intentionally stops the validator, it'll safely terminate operations.
@@ -627,30 +630,32 @@ class Validator:
 
     async def resync_metagraph(self):
         """Resyncs the metagraph and updates the hotkeys and moving averages based on the new metagraph."""
-        # Copies state of metagraph before syncing.
-        previous_metagraph = copy.deepcopy(self.metagraph)
+        # Only the axons and hotkeys are compared after syncing, and sync rebinds
+        # both lists, so shallow copies are enough instead of a full deepcopy.
+        previous_axons = list(self.metagraph.axons)
+        previous_hotkeys = list(self.metagraph.hotkeys)
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
 
         # Check if the metagraph axon info has changed.
-        if previous_metagraph.axons == self.metagraph.axons:
+        if previous_axons == self.metagraph.axons:
             return
 
         logger.info(
             "Metagraph updated, re-syncing hotkeys, dendrite pool and moving averages"
         )
         # Zero out all hotkeys that have been replaced.
-        for uid, hotkey in enumerate(previous_metagraph.hotkeys):
+        for uid, hotkey in enumerate(previous_hotkeys):
             if hotkey != self.metagraph.hotkeys[uid]:
                 self.scores[uid] = 0  # hotkey has been replaced
 
         # Check to see if the metagraph has changed size.
         # If so, we need to add new hotkeys and moving averages.
-        if len(previous_metagraph.hotkeys) < len(self.metagraph.hotkeys):
+        if len(previous_hotkeys) < len(self.metagraph.hotkeys):
             # Update the size of the moving average scores.
             new_moving_average = torch.zeros(len(self.metagraph.hotkeys))
-            min_len = min(len(previous_metagraph.hotkeys), len(self.scores))
+            min_len = min(len(previous_hotkeys), len(self.scores))
             new_moving_average[:min_len] = self.scores[:min_len]
             async with self._scores_alock:
                 self.scores = torch.clamp(new_moving_average, min=0.0)
@@ -672,14 +677,14 @@ class Validator:
         # scores dimensions might have been updated after resyncing... len(uids) != len(self.scores)
         rewards = torch.zeros((len(self.metagraph.hotkeys),))
         existing_scores = torch.zeros((len(self.metagraph.hotkeys),))
+        hotkey_to_uid = get_hotkey_to_uid(self.metagraph)
         for index, (key, value) in enumerate(hotkey_to_scores.items()):
             # handle nan values
             if nan_value_indices[index]:
                 rewards[key] = 0.0  # type: ignore
             # search metagraph for hotkey and grab uid
-            try:
-                uid = self.metagraph.hotkeys.index(key)
-            except ValueError:
+            uid = hotkey_to_uid.get(key)
+            if uid is None:
                 logger.warning("Old hotkey found from previous metagraph")
                 continue
 
@@ -803,9 +808,10 @@ class Validator:
             task_synapse = TaskResultRequest(task_id=task_id)
 
             # Use Dendrite to communicate with the Axon
-            miner_axon = self.metagraph.axons[
-                self.metagraph.hotkeys.index(miner_hotkey)
-            ]
+            miner_uid = get_hotkey_to_uid(self.metagraph).get(miner_hotkey)
+            if miner_uid is None:
+                raise ValueError(f"Miner hotkey not found in metagraph: {miner_hotkey}")
+            miner_axon = self.metagraph.axons[miner_uid]
             if not miner_axon:
                 raise ValueError(f"Miner Axon not found for hotkey: {miner_hotkey}")
 
@@ -836,19 +842,22 @@ class Validator:
         model_id_to_avg_rank = defaultdict(float)
         model_id_to_avg_score = defaultdict(float)
         num_ranks_by_workers, num_scores_by_workers = 0, 0
+        # compare against plain str values, not enum members, inside the loop
+        ranking_criteria = CriteriaTypeEnum.RANKING_CRITERIA.value
+        multi_score_criteria = CriteriaTypeEnum.MULTI_SCORE.value
 
         for result in task_results:
             for result_data in result.result_data:
                 type = result_data.type
                 value = result_data.value
-                if type == CriteriaTypeEnum.RANKING_CRITERIA:
+                if type == ranking_criteria:
                     for model_id, rank in value.items():
                         real_model_id = obfuscated_to_real_model_id.get(
                             model_id, model_id
                         )
                         model_id_to_avg_rank[real_model_id] += rank
                     num_ranks_by_workers += 1
-                elif type == CriteriaTypeEnum.MULTI_SCORE:
+                elif type == multi_score_criteria:
                     for model_id, score in value.items():
                         real_model_id = obfuscated_to_real_model_id.get(
                             model_id, model_id
@@ -1002,8 +1011,8 @@ class Validator:
     async def update_score_and_send_feedback(self):
         while True:
             await asyncio.sleep(dojo.VALIDATOR_UPDATE_SCORE)
-            # for each hotkey, a list of scores from all tasks being scored
-            hotkey_to_all_scores = defaultdict(list)
+            # for each hotkey, running [sum, count] of scores across all scored tasks
+            hotkey_to_all_scores = defaultdict(lambda: [0.0, 0])
             try:
                 validator_hotkeys: List[str] = self._get_validator_hotkeys()
 
@@ -1033,12 +1042,18 @@ class Validator:
                     if not task_batch:
                         continue
 
-                    for task in task_batch:
-                        processed_id, hotkey_to_score = await self._score_task(task)
+                    # tasks are scored independently, so overlap sending each
+                    # task's scores to miners instead of awaiting them one by one
+                    results = await asyncio.gather(
+                        *(self._score_task(task) for task in task_batch)
+                    )
+                    for processed_id, hotkey_to_score in results:
                         if processed_id:
                             processed_request_ids.append(processed_id)
                         for hotkey, score in hotkey_to_score.items():
-                            hotkey_to_all_scores[hotkey].append(score)
+                            entry = hotkey_to_all_scores[hotkey]
+                            entry[0] += score
+                            entry[1] += 1
 
                 if processed_request_ids:
                     await ORM.mark_tasks_processed_by_request_ids(processed_request_ids)
@@ -1050,9 +1065,9 @@ class Validator:
                 # average scores across all tasks being scored by this trigger to update_scores
                 # so miners moving average decay is lower and we incentivise quality > quantity
                 final_hotkey_to_score = {
-                    hotkey: sum(scores) / len(scores)
-                    for hotkey, scores in hotkey_to_all_scores.items()
-                    if scores
+                    hotkey: total / count
+                    for hotkey, (total, count) in hotkey_to_all_scores.items()
+                    if count
                 }
                 logger.debug(
                     f"📝 Got hotkey to score across all tasks between expire_at from:{expire_from} and expire_at to:{expire_to}: {final_hotkey_to_score}"
@@ -1081,9 +1096,27 @@ class Validator:
                 if not task_batch:
                     continue
 
-                for task in task_batch:
+                # one query for the model id mappings of the whole batch
+                real_model_ids = await ORM.get_real_model_ids_by_request_ids(
+                    [task.request.request_id for task in task_batch]
+                )
+                # fetching task results is I/O bound and independent per task,
+                # so query the miners for every task in the batch concurrently,
+                # while the semaphore keeps the number of in-flight miner queries
+                # across all of them at the per task limit
+                miner_query_semaphore = asyncio.Semaphore(self._miner_query_limit)
+                batch_miner_responses = await asyncio.gather(
+                    *(
+                        self._update_task(
+                            task,
+                            real_model_ids[task.request.request_id],
+                            miner_query_semaphore,
+                        )
+                        for task in task_batch
+                    )
+                )
+                for task, miner_responses in zip(task_batch, batch_miner_responses):
                     request_id = task.request.request_id
-                    miner_responses = await self._update_task(task)
                     all_miner_responses.extend(miner_responses)
                     all_request_ids.append(request_id)
 
@@ -1114,10 +1147,13 @@ class Validator:
 
         Returns a list of validator hotkeys.
         """
+        # same threshold as `is_miner`, applied to all stakes in one vectorised
+        # comparison instead of converting the stake array once per uid
+        is_validator = np.asarray(self.metagraph.S) >= dojo.VALIDATOR_MIN_STAKE
         validator_hotkeys: List[str] = [
             hotkey
-            for uid, hotkey in enumerate(self.metagraph.hotkeys)
-            if not is_miner(self.metagraph, uid)
+            for hotkey, is_vali in zip(self.metagraph.hotkeys, is_validator.tolist())
+            if is_vali
         ]
         if get_config().ignore_min_stake:
             validator_hotkeys.append(self.wallet.hotkey.ss58_address)
@@ -1141,22 +1177,27 @@ class Validator:
                 logger.success(
                     "No more unexpired tasks found for processing, exiting task monitoring."
                 )
-                gc.collect()
                 break
             yield task_batch
 
-    async def _update_task(self, task: DendriteQueryResponse) -> List[FeedbackRequest]:
+    async def _update_task(
+        self,
+        task: DendriteQueryResponse,
+        obfuscated_to_real_model_id: Dict[str, str],
+        miner_query_semaphore: asyncio.Semaphore,
+    ) -> List[FeedbackRequest]:
         """
         Returns a list of updated miner responses
         """
-        request_id: str = task.request.request_id
-        obfuscated_to_real_model_id: Dict[str, str] = await ORM.get_real_model_ids(
-            request_id
-        )
-
         updated_miner_responses: List[FeedbackRequest] = []
 
-        batch_size = 30
+        async def _update_miner_response_limited(miner_response: FeedbackRequest):
+            async with miner_query_semaphore:
+                return await self._update_miner_response(
+                    miner_response, obfuscated_to_real_model_id
+                )
+
+        batch_size = self._miner_query_limit
         num_batches = math.ceil(len(task.miner_responses) / batch_size)
         for i in range(0, len(task.miner_responses), batch_size):
             safe_lim = min(i + batch_size, len(task.miner_responses))
@@ -1165,8 +1206,7 @@ class Validator:
             logger.debug(f"Processing batch {i//batch_size + 1} of {num_batches}")
 
             tasks = [
-                self._update_miner_response(miner_response, obfuscated_to_real_model_id)
-                for miner_response in batch
+                _update_miner_response_limited(miner_response) for miner_response in batch
             ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -1368,38 +1408,53 @@ class Validator:
                 "consensus": mean_weighted_consensus_scores,
                 "ground_truth": mean_weighted_gt_scores,
             },
-            "hotkey_to_dojo_task_scores_and_gt": await self._get_dojo_task_scores_and_gt(
-                task.miner_responses
+            "hotkey_to_dojo_task_scores_and_gt": self._get_dojo_task_scores_and_gt(
+                task
             ),
         }
 
-        wandb_data = jsonable_encoder(
-            {
-                "request_id": task.request.request_id,
-                "task": task.request.task_type,
-                "criteria": task.request.criteria_types,
-                "prompt": task.request.prompt,
-                "completions": jsonable_encoder(task.request.completion_responses),
-                "num_completions": len(task.request.completion_responses),
-                "scores": score_data,
-                "num_responses": len(task.miner_responses),
-            }
-        )
+        # everything except the pydantic models is already JSON safe, so dump
+        # those directly rather than walking the whole dict twice
+        wandb_data = {
+            "request_id": task.request.request_id,
+            "task": task.request.task_type,
+            "criteria": [
+                criteria.model_dump(mode="json")
+                for criteria in task.request.criteria_types
+            ],
+            "prompt": task.request.prompt,
+            # unset rank_id/score are dropped rather than logged as nulls
+            "completions": [
+                completion.model_dump(mode="json", exclude_none=True)
+                for completion in task.request.completion_responses
+            ],
+            "num_completions": len(task.request.completion_responses),
+            "scores": score_data,
+            "num_responses": len(task.miner_responses),
+        }
 
         wandb.log(wandb_data, commit=True)
 
-    async def _get_dojo_task_scores_and_gt(
-        self, miner_responses: List[FeedbackRequest]
-    ):
-        """Get the scores and ground truth for each miner response"""
+    def _get_dojo_task_scores_and_gt(self, task: DendriteQueryResponse):
+        """Get the scores and ground truth for each miner response.
+
+        Built from the task that was just scored, which already holds the miner
+        completions and the validator request's ground truth, instead of
+        querying the database again for every miner response.
+        """
+        ground_truth = task.request.ground_truth
         hotkey_to_dojo_task_scores_and_gt = []
-        for miner_response in miner_responses:
+        for miner_response in task.miner_responses:
             if miner_response.dojo_task_id is not None:
-                model_to_score_and_gt_map = (
-                    await ORM.get_scores_and_ground_truth_by_dojo_task_id(
-                        miner_response.dojo_task_id
-                    )
-                )
+                model_to_score_and_gt_map = {
+                    completion.model: {
+                        "score": completion.score,
+                        "ground_truth_rank_id": ground_truth.get(
+                            completion.completion_id
+                        ),
+                    }
+                    for completion in miner_response.completion_responses
+                }
                 hotkey_to_dojo_task_scores_and_gt.append(
                     {
                         "hotkey": miner_response.axon.hotkey,
@@ -8,7 +8,7 @@ import bittensor as bt
 import httpx
 import numpy as np
 from bittensor.utils.btlogging import logging as logger
-from pydantic import BaseModel, model_serializer
+from pydantic import BaseModel
 
 from commons.exceptions import (
     NoNewExpiredTasksYet,
@@ -17,6 +17,7 @@ from commons.objects import ObjectManager
 from database.client import connect_db, disconnect_db
 from database.mappers import (
     map_feedback_request_model_to_feedback_request,
+    map_miner_response_model_to_feedback_request,
 )
 from database.prisma.models import (
     Feedback_Request_Model,
@@ -57,17 +58,6 @@ class Row(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-    @model_serializer
-    def serialize_model(self):
-        """Custom serializer method to ensure that types such as np.ndarray and torch.tensor are serialized correctly"""
-        return {
-            "prompt": self.prompt,
-            "completions": self.completions,
-            "raw_scores": self.raw_scores,
-            "mean_scores": self.mean_scores,
-            "cid_to_ground_truth_rank": self.cid_to_ground_truth_rank,
-        }
-
 
 async def build_jsonl(filename: str):
     with open(filename, "w") as file:
@@ -77,6 +67,7 @@ async def build_jsonl(filename: str):
             if not has_more_batches and not task_batch:
                 break
 
+            lines = []
             for task in task_batch:
                 # Extract prompt from validator request
                 prompt = task.request.prompt
@@ -118,8 +109,11 @@ async def build_jsonl(filename: str):
                         cid_to_ground_truth_rank={},
                     )
 
-                # Write the entry as a JSON line
-                file.write(jsonl_row.model_dump_json() + "\n")
+                lines.append(jsonl_row.model_dump_json())
+
+            # Write the batch as JSON lines in one go
+            if lines:
+                file.write("\n".join(lines) + "\n")
 
             task_count += len(task_batch)
             logger.info(f"Scraped task count: {task_count}")
@@ -203,9 +197,7 @@ async def get_processed_tasks(
 
             m_responses = list(
                 map(
-                    lambda x: map_feedback_request_model_to_feedback_request(
-                        x, is_miner=True
-                    ),
+                    map_miner_response_model_to_feedback_request,
                     [m for m in miner_responses if m.parent_id == validator_request.id],
                 )
             )
@@ -221,7 +213,7 @@ async def get_processed_tasks(
     yield [], False
 
 
-async def upload(hotkey: str, signature: str, message: str, filename: str):
+async def upload(hotkey: str, signature: str, message: str, filename: str) -> bool:
     if not signature.startswith("0x"):
         signature = f"0x{signature}"
 
@@ -232,64 +224,68 @@ async def upload(hotkey: str, signature: str, message: str, filename: str):
         "message": message,
     }
     # Add file to form data if it exists
-    if os.path.exists(filename):
-        chunks = await chunk_file(filename, MAX_CHUNK_SIZE_MB)
-
-        # Make request using httpx
-        async with httpx.AsyncClient() as client:
-            for chunk_filename, chunk_content in chunks:
-                # Append to files list with correct format
-                files = [("files", (chunk_filename, chunk_content, "application/json"))]
-                response = await client.post(
-                    f"{DATASET_SERVICE_BASE_URL}/upload_dataset",
-                    data=form_body,
-                    files=files,
-                    timeout=60.0,
-                )
-                logger.info(f"Status: {response.status_code}")
-                response_json = response.json()
-                logger.info(f"Response: {response_json}")
-                is_success = response.status_code == 200 and response_json.get(
-                    "success"
-                )
-                if not is_success:
-                    raise Exception(f"Failed to upload file {chunk_filename}")
-                await asyncio.sleep(1)
-
-
-async def chunk_file(filename: str, chunk_size_mb: int = 50):
+    if not os.path.exists(filename):
+        return False
+
+    # Make request using httpx
+    async with httpx.AsyncClient() as client:
+        # chunks are read lazily, so only one chunk is held in memory at a time
+        async for chunk_filename, chunk_content in chunk_file(
+            filename, MAX_CHUNK_SIZE_MB
+        ):
+            # Append to files list with correct format
+            files = [("files", (chunk_filename, chunk_content, "application/json"))]
+            response = await client.post(
+                f"{DATASET_SERVICE_BASE_URL}/upload_dataset",
+                data=form_body,
+                files=files,
+                timeout=60.0,
+            )
+            logger.info(f"Status: {response.status_code}")
+            response_json = response.json()
+            logger.info(f"Response: {response_json}")
+            is_success = response.status_code == 200 and response_json.get("success")
+            if not is_success:
+                raise Exception(f"Failed to upload file {chunk_filename}")
+            await asyncio.sleep(1)
+    return True
+
+
+async def chunk_file(
+    filename: str, chunk_size_mb: int = 50
+) -> AsyncGenerator[tuple[str, bytes], None]:
+    """Yield (chunk filename, chunk bytes) for the file, split on line
+    boundaries into chunks of at most `chunk_size_mb`."""
     chunk_size = chunk_size_mb * 1024 * 1024  # Convert MB to bytes
 
-    if os.path.exists(filename):
-        async with aiofiles.open(filename) as f:  # Open in text mode
-            chunks = []
-            current_chunk = []
-            current_chunk_size = 0
-
-            # ensure that when we chunk, we don't split across lines
-            async for line in f:
-                line_size = len(line.encode("utf-8"))  # Get size of line in bytes
-                if current_chunk_size + line_size > chunk_size:
-                    # Use consistent format
-                    base, ext = os.path.splitext(filename)
-                    chunk_filename = f"{base}_part{len(chunks) + 1}{ext}"
-                    chunks.append((chunk_filename, "".join(current_chunk)))
-                    current_chunk = []
-                    current_chunk_size = 0
-
-                current_chunk.append(line)
-                current_chunk_size += line_size
-
-            # Use same format for last chunk
-            if current_chunk:
-                base, ext = os.path.splitext(filename)
-                chunk_filename = f"{base}_part{len(chunks) + 1}{ext}"
-                chunks.append((chunk_filename, "".join(current_chunk)))
-
-            return chunks
-    else:
+    if not os.path.exists(filename):
         raise FileNotFoundError(f"Test file {filename} not found")
 
+    base, ext = os.path.splitext(filename)
+    num_chunks = 0
+    # read raw bytes, line sizes are then just len() and the joined chunks
+    # go to httpx as is, without re-encoding to utf-8
+    async with aiofiles.open(filename, "rb") as f:
+        current_chunk = []
+        current_chunk_size = 0
+
+        # ensure that when we chunk, we don't split across lines
+        async for line in f:
+            line_size = len(line)
+            if current_chunk and current_chunk_size + line_size > chunk_size:
+                num_chunks += 1
+                yield f"{base}_part{num_chunks}{ext}", b"".join(current_chunk)
+                current_chunk = []
+                current_chunk_size = 0
+
+            current_chunk.append(line)
+            current_chunk_size += line_size
+
+        # Use same format for last chunk
+        if current_chunk:
+            num_chunks += 1
+            yield f"{base}_part{num_chunks}{ext}", b"".join(current_chunk)
+
 
 async def main():
     await connect_db()
@@ -309,6 +305,12 @@ async def main():
         await build_jsonl(filename)
 
     try:
+        # nothing was scraped, skip connecting to the dataset service at all
+        if os.path.getsize(filename) == 0:
+            logger.info(f"No tasks to upload, removing empty dataset file {filename}")
+            os.remove(filename)
+            return
+
         upload_success = await upload(hotkey, signature, message, filename)
         if upload_success:
             logger.info("Upload successful! Removing local dataset file.")
@@ -321,11 +323,11 @@ async def main():
 
 async def _test_chunking():
     filename = "dummy_dataset.jsonl"
-    chunks = await chunk_file(filename, MAX_CHUNK_SIZE_MB)
-    logger.info(f"number of chunks: {len(chunks)}")
-    for i, (chunk_filename, chunk_content) in enumerate(chunks, 1):
+    i = 0
+    async for chunk_filename, chunk_content in chunk_file(filename, MAX_CHUNK_SIZE_MB):
+        i += 1
         logger.info(f"\nSaving chunk {i} to {chunk_filename}")
-        async with aiofiles.open(chunk_filename, "w") as f:
+        async with aiofiles.open(chunk_filename, "wb") as f:
             await f.write(chunk_content)
         logger.info(f"Saved chunk {i} ({len(chunk_content)} bytes)")
 
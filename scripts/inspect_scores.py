@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import List
 
 import torch
+from safetensors.torch import load_file
 from tabulate import tabulate
 from termcolor import colored
 
@@ -29,7 +30,12 @@ def format_score_table(scores: torch.Tensor) -> List[List[str]]:
 
 def inspect_scores(file_path: Path = ScoreStorage.SCORES_FILE, show_all: bool = False):
     try:
-        scores = torch.load(file_path)
+        if file_path.suffix == ".safetensors":
+            scores = load_file(file_path)[ScoreStorage.SCORES_KEY]
+        else:
+            scores = torch.load(
+                file_path, map_location="cpu", mmap=True, weights_only=True
+            )
 
         # Print Summary
         print(colored("\n=== Scores Summary ===", "blue", attrs=["bold"]))
@@ -4,8 +4,8 @@ import random
 import traceback
 from datetime import datetime, timezone
 
-import redis
 from bittensor.utils.btlogging import logging as logger
+from redis import asyncio as aioredis
 
 from commons.utils import get_new_uuid
 from dojo.protocol import FeedbackRequest, Result, TaskResult, TaskResultRequest
@@ -17,10 +17,11 @@ class MinerSim(Miner):
     def __init__(self):
         super().__init__()
         try:
-            # Initialize Redis connection
+            # Initialize Redis connection, async so the synapse handlers don't
+            # block the event loop on every round trip
             host = os.getenv("REDIS_HOST", "localhost")
             port = int(os.getenv("REDIS_PORT", 6379))
-            self.redis_client = redis.Redis(
+            self.redis_client = aioredis.Redis(
                 host=host, port=port, db=0, decode_responses=True
             )
             logger.info("Redis connection established")
@@ -64,7 +65,7 @@ class MinerSim(Miner):
             self.hotkey_to_request[synapse.dendrite.hotkey] = synapse
 
             redis_key = f"feedback:{synapse.request_id}"
-            self.redis_client.set(
+            await self.redis_client.set(
                 redis_key,
                 new_synapse.model_dump_json(),
                 ex=86400,  # expire after 24 hours
@@ -98,7 +99,7 @@ class MinerSim(Miner):
             #     return None
 
             redis_key = f"feedback:{synapse.task_id}"
-            request_data = self.redis_client.get(redis_key)
+            request_data = await self.redis_client.get(redis_key)
 
             request_dict = json.loads(request_data) if request_data else None
             feedback_request = FeedbackRequest(**request_dict) if request_dict else None
@@ -130,7 +131,7 @@ class MinerSim(Miner):
             synapse.task_results = task_results
             logger.info(f"TaskResultRequest: {synapse}")
 
-            self.redis_client.delete(redis_key)
+            await self.redis_client.delete(redis_key)
             logger.debug(f"Processed task result for task {synapse.task_id}")
 
             return synapse
@@ -0,0 +1,78 @@
+import pytest
+import sr25519
+from scalecodec.utils.ss58 import ss58_encode
+
+from commons import crypto
+
+MESSAGE = "dataset upload message"
+
+
+@pytest.fixture
+def keypair():
+    return sr25519.pair_from_seed(bytes(range(32)))
+
+
+@pytest.fixture
+def hotkey(keypair):
+    public_key, _ = keypair
+    return ss58_encode(public_key, ss58_format=crypto.SS58_FORMAT)
+
+
+def test_get_public_key_decodes_hotkey(keypair, hotkey):
+    public_key, _ = keypair
+    assert crypto.get_public_key(hotkey) == public_key
+
+
+def test_get_public_key_rejects_invalid_ss58():
+    with pytest.raises(ValueError):
+        crypto.get_public_key("not-a-hotkey")
+
+
+def test_get_public_key_rejects_other_ss58_format(keypair):
+    public_key, _ = keypair
+    with pytest.raises(ValueError):
+        crypto.get_public_key(ss58_encode(public_key, ss58_format=0))
+
+
+def test_verify_plain_signature(keypair, hotkey):
+    signature = sr25519.sign(keypair, MESSAGE.encode())
+    public_key = crypto.get_public_key(hotkey)
+
+    assert crypto.verify(public_key, MESSAGE, signature)
+    assert crypto.verify(public_key, MESSAGE, "0x" + signature.hex())
+    assert crypto.verify(public_key, "0x" + MESSAGE.encode().hex(), signature)
+
+
+def test_verify_bytes_wrapped_signature(keypair, hotkey):
+    # polkadot-js wraps the message in <Bytes></Bytes> before signing
+    signature = sr25519.sign(keypair, b"<Bytes>" + MESSAGE.encode() + b"</Bytes>")
+
+    assert crypto.verify(crypto.get_public_key(hotkey), MESSAGE, "0x" + signature.hex())
+
+
+def test_verify_rejects_wrong_message(keypair, hotkey):
+    signature = sr25519.sign(keypair, MESSAGE.encode())
+
+    assert not crypto.verify(crypto.get_public_key(hotkey), "other message", signature)
+
+
+def test_verify_rejects_other_key(keypair):
+    signature = sr25519.sign(keypair, MESSAGE.encode())
+    other_public_key, _ = sr25519.pair_from_seed(bytes(32))
+
+    assert not crypto.verify(other_public_key, MESSAGE, signature)
+
+
+def test_verify_rejects_bad_lengths(keypair, hotkey):
+    signature = sr25519.sign(keypair, MESSAGE.encode())
+    public_key = crypto.get_public_key(hotkey)
+
+    with pytest.raises(ValueError):
+        crypto.verify(public_key, MESSAGE, signature[:32])
+    with pytest.raises(ValueError):
+        crypto.verify(public_key[:16], MESSAGE, signature)
+
+
+def test_verify_rejects_non_hex_signature_string(hotkey):
+    with pytest.raises(TypeError):
+        crypto.verify(crypto.get_public_key(hotkey), MESSAGE, "not-hex")
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+import torch
+from safetensors.torch import save_file
+
+from commons.score_storage import ScoreStorage
+
+
+@pytest.fixture
+def score_storage(tmp_path, monkeypatch):
+    scores_dir = tmp_path / "scores"
+    monkeypatch.setattr(ScoreStorage, "SCORES_DIR", scores_dir)
+    monkeypatch.setattr(
+        ScoreStorage, "SCORES_FILE", scores_dir / "miner_scores.safetensors"
+    )
+    monkeypatch.setattr(
+        ScoreStorage, "LEGACY_SCORES_FILE", scores_dir / "miner_scores.pt"
+    )
+    monkeypatch.setattr(ScoreStorage, "_cached_scores", None)
+    monkeypatch.setattr(ScoreStorage, "_cached_mtime_ns", None)
+    return ScoreStorage
+
+
+@pytest.mark.asyncio
+async def test_load_without_scores_file(score_storage):
+    assert await score_storage.load() is None
+
+
+@pytest.mark.asyncio
+async def test_save_then_load_round_trip(score_storage):
+    scores = torch.tensor([0.0, 0.25, 0.5, 1.0])
+
+    await score_storage.save(scores)
+
+    assert score_storage.SCORES_FILE.exists()
+    assert not score_storage.SCORES_FILE.with_suffix(".tmp").exists()
+    assert torch.equal(await score_storage.load(), scores)
+
+
+@pytest.mark.asyncio
+async def test_load_migrates_legacy_file(score_storage):
+    scores = torch.tensor([0.1, 0.2, 0.3])
+    score_storage.SCORES_DIR.mkdir()
+    torch.save(scores, score_storage.LEGACY_SCORES_FILE)
+
+    loaded = await score_storage.load()
+
+    assert torch.equal(loaded, scores)
+    assert not score_storage.LEGACY_SCORES_FILE.exists()
+    assert score_storage.SCORES_FILE.exists()
+    assert torch.equal(await score_storage.load(), scores)
+
+
+@pytest.mark.asyncio
+async def test_external_rewrite_invalidates_cache(score_storage):
+    await score_storage.save(torch.tensor([1.0, 2.0]))
+    assert torch.equal(await score_storage.load(), torch.tensor([1.0, 2.0]))
+
+    rewritten = torch.tensor([3.0, 4.0, 5.0])
+    save_file({score_storage.SCORES_KEY: rewritten}, score_storage.SCORES_FILE)
+    # make sure the mtime moves even on filesystems with coarse timestamps
+    stat = score_storage.SCORES_FILE.stat()
+    os.utime(
+        score_storage.SCORES_FILE,
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+    )
+
+    assert torch.equal(await score_storage.load(), rewritten)
+
+
+@pytest.mark.asyncio
+async def test_load_returns_a_copy(score_storage):
+    scores = torch.tensor([0.5, 0.5])
+    await score_storage.save(scores)
+
+    loaded = await score_storage.load()
+    loaded[0] = 100.0
+    # the saved tensor is copied as well
+    scores[1] = 100.0
+
+    assert torch.equal(await score_storage.load(), torch.tensor([0.5, 0.5]))
@@ -442,3 +442,23 @@ def test_spearman_correlation_known_values(scoring_module):
             torch.tensor(miner_b_spearman, dtype=torch.float32),
             atol=1e-6,
         ), f"Expected Spearman score for Miner B: {miner_b_spearman}, got: {spearman_score[1]}"
+
+
+def test_icc2_by_rater_known_values():
+    from commons.scoring import _icc2_by_rater
+
+    ratings = np.array(
+        [
+            [1, 2],
+            [2, 2],
+            [3, 4],
+            [4, 5],
+            [5, 4],
+        ]
+    )
+    icc = _icc2_by_rater(ratings, np.array([1, 2, 3, 4, 5]))
+
+    # first rater agrees perfectly with the average
+    assert np.isclose(icc[0], 1.0)
+    # reference value from pingouin.intraclass_corr ICC2
+    assert np.isclose(icc[1], 0.8139534883720934)